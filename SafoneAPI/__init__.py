@@ -22,5 +22,6 @@ SOFTWARE.
 """
 
 from .api import *
+from .sync import SafoneAPISync
 
 __version__ = "1.0.69"
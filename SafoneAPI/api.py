@@ -23,15 +23,17 @@ SOFTWARE.
 
 import time
 import asyncio
+import logging
 import aiohttp
-import aiofiles
 from io import BytesIO
-from base64 import b64decode
-from typing import Union, List
-from pyrogram.types import Message, User
+from binascii import a2b_base64
+from typing import TYPE_CHECKING, Any, AsyncIterator, Awaitable, Callable, Iterable, List, Mapping, Tuple, Type, Union
+from concurrent.futures import Executor, ProcessPoolExecutor
 
 from .errors import (
+    CircuitOpen,
     TimeoutError,
+    DeadlineExceeded,
     InvalidContent,
     InvalidRequest,
     GenericApiError,
@@ -39,13 +41,39 @@ from .errors import (
     RateLimitExceeded,
 )
 from .results import Result
+from .middleware import Middleware, Request, Response, build_chain, match_route
+from .retry import RetryPolicy
+from .ratelimit import RateLimiter, SharedTokenBucket, SQLiteRateStore, TokenBucket
+from .coalesce import Coalescer
+from .hedge import Hedger
+from .breaker import CircuitBreaker
+from .metrics import Metrics
+from .tracing import OpenTelemetryExporter, Span, trace_config
+from .telegram import full_name, is_message, message_text
+from .timeouts import DEFAULT as DEFAULT_TIMEOUT, Timeout, current_deadline, deadline, remaining, within
+from .endpoints import DEFAULT_TIMEOUTS, ENDPOINTS, ROUTES, Endpoint, Param, generate_endpoints, with_deadline
+from .cache import MemoryCache, ResponseCache, SQLiteCache
+from .streaming import MediaStreamParser
+from .uploads import FileInput, Upload, build_form
+from .jsonlib import JSONCodec
+from .monitor import LoopLagMonitor
+from .batch import map_calls
+from .pagination import page_items, paginate
 
 from aiohttp.client_exceptions import (
+    ClientError,
     ContentTypeError,
-    ClientConnectorError,
 )
 
+if TYPE_CHECKING:
+    from pyrogram.types import Message, User
 
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+_log = logging.getLogger(__name__)
+
+
+@generate_endpoints
 class SafoneAPI:
     """
     SafoneAPI class to access all the endpoints
@@ -55,327 +83,468 @@ class SafoneAPI:
 
     """
 
-    def __init__(self, api: str = None, session: aiohttp.ClientSession = None):
+    def __init__(
+        self,
+        api: str = None,
+        session: Union[aiohttp.ClientSession, Type[aiohttp.ClientSession]] = None,
+        limit: int = 100,
+        limit_per_host: int = 0,
+        keepalive_timeout: float = 15,
+        ttl_dns_cache: int = 300,
+        middlewares: List[Middleware] = None,
+        retry: Union[RetryPolicy, bool] = None,
+        rate_limiter: RateLimiter = None,
+        coalesce: Union[Coalescer, bool] = True,
+        cache: ResponseCache = None,
+        stream_threshold: int = 256 * 1024,
+        json_codec: JSONCodec = None,
+        executor: Executor = None,
+        offload_threshold: int = 128 * 1024,
+        hedge: Union[Hedger, bool] = None,
+        breaker: Union[CircuitBreaker, bool] = None,
+        timeout: Union[Timeout, float] = None,
+        timeouts: Mapping[str, Union[Timeout, float]] = None,
+        metrics: Union[Metrics, bool] = None,
+        trace: Callable[[Span], None] = None,
+    ):
+        """
+        Parameters:
+                api (str): Base url of the api [OPTIONAL]
+                session (ClientSession): Session class or an already-constructed session to reuse [OPTIONAL]
+                limit (int): Total number of pooled connections, 0 for unlimited [OPTIONAL]
+                limit_per_host (int): Pooled connections per host, 0 for unlimited [OPTIONAL]
+                keepalive_timeout (float): Seconds to keep idle connections open [OPTIONAL]
+                ttl_dns_cache (int): Seconds to cache resolved DNS entries [OPTIONAL]
+                middlewares (List[Middleware]): Request interceptors, outermost first [OPTIONAL]
+                retry (RetryPolicy): Retry policy for failed calls, False to disable retries [OPTIONAL]
+                rate_limiter (RateLimiter): Client-side pacing of calls per route and globally [OPTIONAL]
+                coalesce (Coalescer): Share identical in-flight GET calls, False to disable [OPTIONAL]
+                cache (ResponseCache): Cache for responses of rarely changing routes [OPTIONAL]
+                stream_threshold (int): Body size from which responses are parsed while streaming, None to disable [OPTIONAL]
+                json_codec (JSONCodec): Json loads/dumps pair, the fastest installed one by default [OPTIONAL]
+                executor (Executor): Pool for heavy response decoding, the loop's default by default. Streamed bodies are always decoded in threads [OPTIONAL]
+                offload_threshold (int): Body size from which decoding runs in the executor, None to disable [OPTIONAL]
+                hedge (Hedger): Duplicate slow calls of interactive routes, True for the default policy [OPTIONAL]
+                breaker (CircuitBreaker): Fail fast on routes which keep failing, False to disable [OPTIONAL]
+                timeout (Timeout): Timeouts of an attempt on routes without their own profile [OPTIONAL]
+                timeouts (Mapping[str, Timeout]): Timeout profile per route, merged over the built-in ones [OPTIONAL]
+                metrics (Metrics): Per-route latency, status, error, byte and cache counters, False to disable [OPTIONAL]
+                trace (Callable[[Span], None]): Receives the phase timings of every call, like an OpenTelemetryExporter; errors it raises are logged [OPTIONAL]
+        """
         self.api = api or "https://api.safone.co/"
-        self.session = session or aiohttp.ClientSession
-
-    def _get_name(self, user: User) -> str:
-        return f"{user.first_name} {user.last_name or ''}".rstrip()
-
-    def _get_fname(self, type: str, count: int = 0) -> str:
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.ttl_dns_cache = ttl_dns_cache
+        if isinstance(session, aiohttp.ClientSession):
+            self.session = type(session)
+            self._client = session
+            self._owns_client = False
+        else:
+            self.session = session or aiohttp.ClientSession
+            self._client = None
+            self._owns_client = True
+        self._clients = {}
+        self._guards = {}
+        self.middlewares = list(middlewares or [])
+        self.retry = RetryPolicy() if retry is None else retry or None
+        self.rate_limiter = rate_limiter
+        self.coalescer = Coalescer() if coalesce is True else coalesce or None
+        self.cache = cache
+        self.stream_threshold = stream_threshold
+        self.json_codec = json_codec or JSONCodec.auto()
+        self.executor = executor
+        self.offload_threshold = offload_threshold
+        self.hedger = Hedger() if hedge is True else hedge or None
+        self.breaker = CircuitBreaker() if breaker is None else breaker or None
+        self.timeout = DEFAULT_TIMEOUT if timeout is None else Timeout.of(timeout)
+        self.timeouts = dict(DEFAULT_TIMEOUTS)
+        self.timeouts.update((route, Timeout.of(value)) for route, value in (timeouts or {}).items())
+        self.metrics = Metrics() if metrics is None else metrics or None
+        self.trace = trace
+        self._build_chain()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+    async def _get_client(self) -> aiohttp.ClientSession:
+        if not self._owns_client:
+            return self._client
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None or client.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                keepalive_timeout=self.keepalive_timeout,
+                ttl_dns_cache=self.ttl_dns_cache,
+            )
+            trace_configs = [trace_config()] if self.trace else None
+            client = self._clients[loop] = self.session(connector=connector, trace_configs=trace_configs)
+            guard = self._guards[loop] = self._close_with_loop(loop, client)
+            await guard.__anext__()
+        return client
+
+    async def _close_with_loop(self, loop: asyncio.AbstractEventLoop, client: aiohttp.ClientSession):
+        # asyncio.run() finalizes the async generators of its loop before closing it,
+        # which closes the session of a loop that is going away.
+        try:
+            yield
+        finally:
+            if self._clients.get(loop) is client:
+                del self._clients[loop]
+                del self._guards[loop]
+            await client.close()
+
+    async def close(self):
+        """
+        Closes the pooled session this client opened on the running event loop.
+        Sessions opened on other loops are closed when asyncio.run() shuts their
+        loop down, and an injected session is left open for its owner to close.
+        """
+        if not self._owns_client:
+            return
+        guard = self._guards.get(asyncio.get_running_loop())
+        if guard is not None:
+            await guard.aclose()
+
+    def _get_name(self, user: "User") -> str:
+        return full_name(user)
+
+    @staticmethod
+    def _get_fname(type: str, count: int = 0) -> str:
         return f"{str(round(time.time()))}_{count}.{type}".rstrip()
 
-    def _decode_bytes(self, file: str, type: str, index: int) -> BytesIO:
-        file_bytes = BytesIO(b64decode(file.encode("utf-8")))
-        file_bytes.name = self._get_fname(type.split("/")[1], index)
+    @staticmethod
+    def _decode_bytes(file: Union[str, bytes], type: str, index: int) -> BytesIO:
+        # a2b_base64 reads ascii strings in place, so the only buffer
+        # allocated is the decoded one, which BytesIO adopts without a copy.
+        file_bytes = BytesIO(file if isinstance(file, bytes) else a2b_base64(file))
+        file_bytes.name = SafoneAPI._get_fname(type.split("/")[1], index)
         return file_bytes
 
-    def _parse_result(self, response: dict) -> Union[Result, List[BytesIO]]:
+    @staticmethod
+    def _parse_result(response: dict) -> Union[Result, List[BytesIO]]:
         type = response.get("type")
+        if type and "audio" in type:
+            return SafoneAPI._decode_bytes(response.get("audio"), type, 0)
+        elif type and "image" in type:
+            images = response.get("image")
+            if isinstance(images, list):
+                return [
+                    SafoneAPI._decode_bytes(image, type, idx)
+                    for idx, image in enumerate(images)
+                ]
+            return SafoneAPI._decode_bytes(images, type, 0)
         error = response.get("error")
         response = Result(response)
         if not error:
             response.success = True
-        if type and "audio" in type:
-            response = self._decode_bytes(response.audio, type, 0)
-        elif type and "image" in type:
-            if isinstance(response.image, list):
-                response = [
-                    self._decode_bytes(image, type, idx)
-                    for idx, image in enumerate(response.image)
-                ]
-            else:
-                response = self._decode_bytes(response.image, type, 0)
         return response
 
-    async def _fetch(self, route, timeout=60, **params):
-        try:
-            async with self.session() as client:
-                resp = await client.get(self.api + route, params=params, timeout=timeout)
-                if resp.status == 429:
-                    raise RateLimitExceeded
-                elif resp.status in (502, 503):
-                    raise ConnectionError
-                response = await resp.json()
-                if resp.status == 400:
-                    raise InvalidRequest(response.get("docs"))
-                elif resp.status == 422:
-                    raise GenericApiError(response.get("error"))
-        except asyncio.TimeoutError:
-            raise TimeoutError
-        except ContentTypeError:
-            raise InvalidContent
-        except ClientConnectorError:
-            raise ConnectionError
-        return self._parse_result(response)
-
-    async def _post_data(self, route, data, timeout=60):
-        try:
-            async with self.session() as client:
-                resp = await client.post(self.api + route, data=data, timeout=timeout)
-                if resp.status == 429:
-                    raise RateLimitExceeded
-                elif resp.status in (502, 503):
-                    raise ConnectionError
-                response = await resp.json()
-                if resp.status == 400:
-                    raise InvalidRequest(response.get("docs"))
-                elif resp.status == 422:
-                    raise GenericApiError(response.get("error"))
-        except asyncio.TimeoutError:
-            raise TimeoutError
-        except ContentTypeError:
-            raise InvalidContent
-        except ClientConnectorError:
-            raise ConnectionError
-        return self._parse_result(response)
-
-    async def _post_json(self, route, json, timeout=60):
-        try:
-            async with self.session() as client:
-                resp = await client.post(self.api + route, json=json, timeout=timeout)
-                if resp.status == 429:
-                    raise RateLimitExceeded
-                elif resp.status in (502, 503):
-                    raise ConnectionError
-                response = await resp.json()
-                if resp.status == 400:
-                    raise InvalidRequest(response.get("docs"))
-                elif resp.status == 422:
-                    raise GenericApiError(response.get("error"))
-        except asyncio.TimeoutError:
-            raise TimeoutError
-        except ContentTypeError:
-            raise InvalidContent
-        except ClientConnectorError:
-            raise ConnectionError
-        return self._parse_result(response)
-
-    async def advice(self):
-        """
-        Returns An Object.
-
-                Returns:
-                        Result object (str): Results which you can access with dot notation
-
-        """
-        return await self._fetch("advice")
-
-    async def astronomy(self):
-        """
-        Returns An Object.
-
-                Returns:
-                        Result object (str): Results which you can access with dot notation
-
-        """
-        return await self._fetch("astronomy")
-
-    async def bully(self):
-        """
-        Returns An Object.
-
-                Returns:
-                        Result object (str): Results which you can access with dot notation
-
-        """
-        return await self._fetch("bully")
-
-    async def fact(self):
-        """
-        Returns An Object.
-
-                Returns:
-                        Result object (str): Results which you can access with dot notation
-
-        """
-        return await self._fetch("fact")
-
-    async def joke(self):
-        """
-        Returns An Object.
-
-                Returns:
-                        Result object (str): Results which you can access with dot notation
-
-        """
-        return await self._fetch("joke")
-
-    async def meme(self):
-        """
-        Returns An Object.
-
-                Returns:
-                        Result object (BytesIO): Results which you can access with filename
-
+    def deadline(self, seconds: float):
         """
-        return await self._fetch("meme")
-
-    async def excuse(self):
-        """
-        Returns An Object.
-
-                Returns:
-                        Result object (str): Results which you can access with dot notation
-
-        """
-        return await self._fetch("excuse")
-
-    async def riddle(self):
-        """
-        Returns An Object.
-
-                Returns:
-                        Result object (str): Results which you can access with dot notation
-
-        """
-        return await self._fetch("riddle")
-
-    async def motivate(self):
-        """
-        Returns An Object.
-
-                Returns:
-                        Result object (str): Results which you can access with dot notation
-
-        """
-        return await self._fetch("motivate")
-
-    async def asq(self, query: str):
-        """
-        Returns An Object.
+        Limits every call made inside the `with` block, retries and queueing included, to `seconds` from now.
 
                 Parameters:
-                        query (str): Query to ask
+                        seconds (float): Time budget of the block
                 Returns:
-                        Result object (str): Results which you can access with dot notation
+                        Context manager, calls raise DeadlineExceeded once the budget is spent
 
         """
-        return await self._fetch("asq", query=query)
+        return deadline(seconds)
 
-    async def shazam(self, file: str):
+    def use(self, middleware: Middleware):
         """
-        Returns An Object.
+        Appends a middleware to the request chain of this client.
 
                 Parameters:
-                        file (str): File path of song
-                Returns:
-                        Result object (str): Results which you can access with dot notation
-
+                        middleware (Middleware): The middleware to install
         """
-        async with aiofiles.open(file, mode="rb") as f:
-            file = await f.read()
-        return await self._post_data("shazam", data={"media": file})
+        self.middlewares.append(middleware)
+        self._build_chain()
 
-    async def insult(self, name: str = ""):
-        """
-        Returns An Object.
-
-                Parameters:
-                        name (str): Name to insult [OPTIONAL]
-                Returns:
-                        Result object (str): Results which you can access with dot notation
-
-        """
-        return await self._fetch("insult", name=name)
-
-    async def quote(self, type: str = ""):
-        """
-        Returns An Object.
-
-                Parameters:
-                        type (str): Type of result (text/image) [OPTIONAL]
-                Returns:
-                        Result object (str): Results which you can access with dot notation
-
-        """
-        return await self._fetch("quote", type=type)
+    def _resolve(self, method: Union[str, Callable[..., Awaitable]]) -> Callable[..., Awaitable]:
+        if isinstance(method, str):
+            if method.startswith("_") or not hasattr(self, method):
+                raise InvalidRequest(f"Unknown endpoint: {method}")
+            return getattr(self, method)
+        return method
 
-    async def truth(self, language: str = "en"):
+    def map(
+        self,
+        method: Union[str, Callable[..., Awaitable]],
+        items: Iterable,
+        concurrency: int = 10,
+        ordered: bool = True,
+    ) -> AsyncIterator[Tuple[int, Any]]:
         """
-        Returns An Object.
+        Runs an endpoint over many argument sets with bounded concurrency.
 
                 Parameters:
-                        language (str): Language of question [OPTIONAL]
+                        method (Union[str, Callable]): Endpoint method or its name, like api.translate or "translate"
+                        items (Iterable): Argument sets, a tuple for positional args, a dict for keyword args or a single value
+                        concurrency (int): Maximum number of calls in flight [OPTIONAL]
+                        ordered (bool): Yield in input order rather than as completed [OPTIONAL]
                 Returns:
-                        Result object (str): Results which you can access with dot notation
+                        Async iterator of (index, result) pairs, failed items yield their error instead
 
         """
-        return await self._fetch("truth", language=language)
+        return map_calls(self._resolve(method), items, concurrency, ordered)
 
-    async def dare(self, language: str = "en"):
+    async def batch(
+        self,
+        method: Union[str, Callable[..., Awaitable]],
+        items: Iterable,
+        concurrency: int = 10,
+    ) -> List[Any]:
         """
-        Returns An Object.
+        Runs an endpoint over many argument sets with bounded concurrency.
 
                 Parameters:
-                        language (str): Language of task [OPTIONAL]
+                        method (Union[str, Callable]): Endpoint method or its name, like api.translate or "translate"
+                        items (Iterable): Argument sets, a tuple for positional args, a dict for keyword args or a single value
+                        concurrency (int): Maximum number of calls in flight [OPTIONAL]
                 Returns:
-                        Result object (str): Results which you can access with dot notation
+                        List of results in input order, failed items hold their error instead
 
         """
-        return await self._fetch("dare", language=language)
+        return [result async for _, result in self.map(method, items, concurrency)]
 
-    async def apps(self, query: str, limit: int = 10):
+    def iter_udemy(
+        self,
+        type: str,
+        max_items: int = None,
+        limit: int = 10,
+        prefetch: int = 1,
+    ) -> AsyncIterator[Any]:
         """
-        Returns An Object.
+        Streams udemy courses page by page, fetching the next pages while the current one is consumed.
 
                 Parameters:
-                        query (str): Query to search
-                        limit (int): Limit the results [OPTIONAL]
-                Returns:
-                        Result object (str): Results which you can access with dot notation
-
-        """
-        return await self._fetch("apps", query=query, limit=limit)
-
-    async def anime(self, query: str):
-        """
-        Returns An Object.
-
-                Parameters:
-                        query (str): Query to search
+                        type (str): Type of course
+                        max_items (int): Stop after this many courses [OPTIONAL]
+                        limit (int): Courses per page [OPTIONAL]
+                        prefetch (int): Pages fetched ahead, at most prefetch + 1 pages are held [OPTIONAL]
                 Returns:
-                        Result object (str): Results which you can access with dot notation
+                        Async iterator of Result objects, one per course
 
         """
-        return await self._fetch("anime/search", query=query)
-
-    async def manga(self, query: str):
-        """
-        Returns An Object.
-
-                Parameters:
-                        query (str): Query to search
-                Returns:
-                        Result object (str): Results which you can access with dot notation
+        async def fetch_page(page):
+            return page_items(await self.udemy(type, page=page, limit=limit))
 
-        """
-        return await self._fetch("anime/manga", query=query)
+        return paginate(fetch_page, max_items, limit, prefetch)
 
-    async def character(self, query: str):
+    def iter_search(
+        self,
+        method: Union[str, Callable[..., Awaitable]],
+        query: str,
+        max_items: int = 10,
+    ) -> AsyncIterator[Any]:
         """
-        Returns An Object.
+        Streams the results of a search endpoint that only takes a limit, like google, github,
+        stackoverflow, torrent, wall or unsplash. Those endpoints have no pages, so the results
+        are fetched in one call sized to the item budget.
 
                 Parameters:
+                        method (Union[str, Callable]): Endpoint method or its name, like api.google or "google"
                         query (str): Query to search
+                        max_items (int): Number of results to fetch [OPTIONAL]
                 Returns:
-                        Result object (str): Results which you can access with dot notation
+                        Async iterator of Result objects, one per search result
 
         """
-        return await self._fetch("anime/character", query=query)
+        func = self._resolve(method)
 
-    async def anime_news(self, limit: int = 10):
-        """
-        Returns An Object.
+        async def fetch_page(page):
+            return page_items(await func(query, limit=max_items)) if page == 1 else []
 
-                Parameters:
-                        limit (int): Limit the results [OPTIONAL]
-                Returns:
-                        Result object (str): Results which you can access with dot notation
+        return paginate(fetch_page, max_items, max_items, prefetch=0)
 
-        """
-        return await self._fetch("anime/news", limit=limit)
+    def _build_chain(self):
+        builtins = (self.cache, self.coalescer, self.retry, self.breaker, self.hedger, self.rate_limiter)
+        outer = [self.metrics] if self.metrics else []
+        middlewares = outer + self.middlewares + [m for m in builtins if m]
+        self._handler = build_chain(middlewares, self._send)
 
+    async def _send(self, request: Request) -> Response:
+        data, headers, uploads = request.data, None, None
+        try:
+            timeout = request.timeout.client_timeout(remaining(request.deadline))
+            if request.json is not None:
+                data, headers = self.json_codec.dumps(request.json), _JSON_HEADERS
+                request.context["bytes_sent"] = len(data)
+            elif data and any(isinstance(value, Upload) for value in data.values()):
+                data, uploads = build_form(data)
+                request.context["bytes_sent"] = sum(upload.size or 0 for upload in uploads)
+            client = await self._get_client()
+            async with client.request(
+                request.method,
+                self.api + request.route,
+                params=request.params,
+                data=data,
+                headers=headers,
+                timeout=timeout,
+                trace_request_ctx=request.context.get("span"),
+            ) as resp:
+                if resp.status == 429:
+                    raise RateLimitExceeded(response=Response(resp.status, resp.headers))
+                elif resp.status in (502, 503):
+                    raise ConnectionError(response=Response(resp.status, resp.headers))
+                response, size = await self._read_json(resp, request)
+                if resp.status == 400:
+                    raise InvalidRequest(response.get("docs"), Response(resp.status, resp.headers, response, size))
+                elif resp.status == 422:
+                    raise GenericApiError(response.get("error"), Response(resp.status, resp.headers, response, size))
+        except asyncio.TimeoutError:
+            if request.deadline is not None and time.monotonic() >= request.deadline:
+                raise DeadlineExceeded
+            raise TimeoutError
+        except ContentTypeError:
+            raise InvalidContent
+        except ClientError:
+            raise ConnectionError
+        finally:
+            for upload in uploads or ():
+                upload.close()
+        return Response(resp.status, resp.headers, response, size)
+
+    async def _read_json(self, resp: aiohttp.ClientResponse, request: Request):
+        length = resp.content_length
+        span = request.context.get("span")
+        started = span.now() if span else 0.0
+        try:
+            if not resp.content_type.endswith("json"):
+                raise InvalidContent
+            if self.stream_threshold is None or (length is not None and length < self.stream_threshold):
+                body = await resp.read()
+                read = span.now() if span else 0.0
+                if self._should_offload(len(body)):
+                    data = await within(request.deadline, self._offload(SafoneAPI._load_result, self.json_codec.loads, body))
+                else:
+                    data = self.json_codec.loads(body)
+                size = len(body)
+            else:
+                parser = MediaStreamParser(loads=self.json_codec.loads)
+                async for chunk in resp.content.iter_chunked(64 * 1024):
+                    if self._should_offload(parser.size):
+                        await self._offload(parser.feed, chunk, threads=True)
+                    else:
+                        parser.feed(chunk)
+                read = span.now() if span else 0.0
+                if self._should_offload(parser.size):
+                    data = await within(request.deadline, self._offload(parser.close, threads=True))
+                else:
+                    data = parser.close()
+                size = parser.size
+        except ValueError:
+            raise InvalidContent
+        if span:
+            span.add("read", started, read - started)
+            span.add("parse", read, span.now() - read)
+        return data, size
+
+    async def _request(self, method: str, route: str, timeout=None, **kwargs):
+        if timeout is None:
+            timeout = match_route(self.timeouts, route, self.timeout)
+        endpoint = match_route(ROUTES, route)
+        idempotent = endpoint.idempotent if endpoint and endpoint.verb == method else None
+        request = Request(method, route, timeout=timeout, deadline=current_deadline(), idempotent=idempotent, **kwargs)
+        if self.trace is None:
+            return await self._call(request)
+        span = request.context["span"] = Span(method, route)
+        try:
+            return await self._call(request)
+        except BaseException as error:
+            span.error = type(error).__name__
+            response = getattr(error, "response", None)
+            if response is not None:
+                span.status = response.status
+            raise
+        finally:
+            span.duration = span.now()
+            try:
+                self.trace(span)
+            except Exception:
+                _log.exception("trace callback failed for %s", route)
+
+    async def _call(self, request: Request):
+        response = await self._handler(request)
+        span = request.context.get("span")
+        if span:
+            span.status = response.status
+            started = span.now()
+        if self._should_offload(response.size) and not self._is_decoded(response.data):
+            result = await within(request.deadline, self._offload(SafoneAPI._parse_result, response.data))
+        else:
+            result = self._parse_result(response.data)
+        if span:
+            span.add("decode", started, span.now() - started)
+        return result
+
+    def _should_offload(self, size: int) -> bool:
+        return self.offload_threshold is not None and size >= self.offload_threshold
+
+    @staticmethod
+    def _is_decoded(data) -> bool:
+        # Offloaded and streamed responses arrive as a Result or with their
+        # media already decoded, so building the result is cheap.
+        if isinstance(data, Result):
+            return True
+        media = data.get("image", data.get("audio")) if isinstance(data, dict) else None
+        if isinstance(media, list):
+            media = media[0] if media else None
+        return isinstance(media, bytes)
+
+    @staticmethod
+    def _load_result(loads: Callable[[bytes], Any], body: bytes):
+        # Runs in the executor and does all the decoding in one trip, so a
+        # process pool pickles the payload once each way. Media stays a dict
+        # with bytes for the middlewares, anything else becomes a Result.
+        data = loads(body)
+        type = data.get("type") if isinstance(data, dict) else None
+        if type and ("audio" in type or "image" in type):
+            field = "audio" if "audio" in type else "image"
+            media = data.get(field)
+            if isinstance(media, list):
+                data[field] = [a2b_base64(item) if isinstance(item, str) else item for item in media]
+            elif isinstance(media, str):
+                data[field] = a2b_base64(media)
+            return data
+        return SafoneAPI._parse_result(data) if isinstance(data, dict) else data
+
+    async def _offload(self, func, *args, threads: bool = False):
+        # The stream parser keeps its state in this process, so it must not go to a process pool.
+        executor = None if threads and isinstance(self.executor, ProcessPoolExecutor) else self.executor
+        return await asyncio.get_running_loop().run_in_executor(executor, func, *args)
+
+    async def _fetch(self, route, timeout=None, **params):
+        return await self._request("GET", route, timeout, params=params)
+
+    async def _post_data(self, route, data, timeout=None):
+        return await self._request("POST", route, timeout, data=data)
+
+    async def _post_json(self, route, json, timeout=None):
+        return await self._request("POST", route, timeout, json=json)
+
+    @with_deadline
+    async def shazam(self, file: FileInput):
+        """
+        Returns An Object.
+
+                Parameters:
+                        file (FileInput): Path, file object, bytes or async byte iterator of song
+                        deadline (float): Seconds the call may take, retries and queueing included [OPTIONAL]
+                Returns:
+                        Result object (str): Results which you can access with dot notation
+
+        """
+        return await self._post_data("shazam", data={"media": Upload(file)})
+
+    @with_deadline
     async def anime_pics(self, type: str, nsfw: bool = False):
         """
         Returns An Object.
@@ -383,434 +552,75 @@ class SafoneAPI:
                 Parameters:
                         type (str): Anime content type
                         nsfw (bool): Whether include adult content [OPTIONAL]
+                        deadline (float): Seconds the call may take, retries and queueing included [OPTIONAL]
                 Returns:
                         Result object (BytesIO): Results which you can access with filename
 
         """
-        if nsfw:
-            return await self._fetch("anime/nsfw/" + type)
-        return await self._fetch("anime/sfw/" + type)
-
-    async def xda(self, query: str, limit: int = 10):
-        """
-        Returns An Object.
-
-                Parameters:
-                        query (str): Query to search
-                        limit (int): Limit the results [OPTIONAL]
-                Returns:
-                        Result object (str): Results which you can access with dot notation
-
-        """
-        return await self._fetch("xda", query=query, limit=limit)
-
-    async def npm(self, query: str, limit: int = 10):
-        """
-        Returns An Object.
-
-                Parameters:
-                        query (str): Query to search
-                        limit (int): Limit the results [OPTIONAL]
-                Returns:
-                        Result object (str): Results which you can access with dot notation
-
-        """
-        return await self._fetch("npm", query=query, limit=limit)
-
-    async def morse(self, text: str, type: str):
-        """
-        Returns An Object.
-
-                Parameters:
-                        text (str): Text to convert
-                        type (str): Type of conversion (encode/decode)
-                Returns:
-                        Result object (str): Results which you can access with dot notation
-
-        """
-        return await self._fetch("morse/" + type, text=text)
-
-    async def udemy(self, type: str, page: int = 1, limit: int = 10):
-        """
-        Returns An Object.
-
-                Parameters:
-                        type (str): Type of course
-                        page (int): Page no to parse [OPTIONAL]
-                        limit (int): Limit the results [OPTIONAL]
-                Returns:
-                        Result object (str): Results which you can access with dot notation
-
-        """
-        return await self._fetch("udemy/" + type, page=page, limit=limit)
-
-    async def ubuntu(self, query: str, limit: int = 10):
-        """
-        Returns An Object.
-
-                Parameters:
-                        query (str): Query to search
-                        limit (int): Limit the results [OPTIONAL]
-                Returns:
-                        Result object (str): Results which you can access with dot notation
-
-        """
-        return await self._fetch("ubuntu", query=query, limit=limit)
-
-    async def google(self, query: str, limit: int = 10):
-        """
-        Returns An Object.
-
-                Parameters:
-                        query (str): Query to search
-                        limit (int): Limit the results [OPTIONAL]
-                Returns:
-                        Result object (str): Results which you can access with dot notation
-
-        """
-        return await self._fetch("google", query=query, limit=limit)
-
-    async def github(self, query: str, limit: int = 10):
-        """
-        Returns An Object.
-
-                Parameters:
-                        query (str): Query to search
-                        limit (int): Limit the results [OPTIONAL]
-                Returns:
-                        Result object (str): Results which you can access with dot notation
-
-        """
-        return await self._fetch("github", query=query, limit=limit)
-
-    async def youtube(self, query: str, limit: int = 10):
-        """
-        Returns An Object.
-
-                Parameters:
-                        query (str): Query to search
-                        limit (int): Limit the results [OPTIONAL]
-                Returns:
-                        Result object (str): Results which you can access with dot notation
-
-        """
-        return await self._fetch("youtube", query=query, limit=limit)
-
-    async def playlist(self, query: str, limit: int = 10):
-        """
-        Returns An Object.
-
-                Parameters:
-                        query (str): Query to search
-                        limit (int): Limit the results [OPTIONAL]
-                Returns:
-                        Result object (str): Results which you can access with dot notation
-
-        """
-        return await self._fetch("playlist", query=query, limit=limit)
-
-    async def wall(self, query: str, limit: int = 10):
-        """
-        Returns An Object.
-
-                Parameters:
-                        query (str): Query to search
-                        limit (int): Limit the results [OPTIONAL]
-                Returns:
-                        Result object (str): Results which you can access with dot notation
-
-        """
-        return await self._fetch("wall", query=query, limit=limit)
-
-    async def news(self, category: str = "", limit: int = 10):
-        """
-        Returns An Object.
-
-                Parameters:
-                        category (str): News category [OPTIONAL]
-                        limit (int): Limit the results [OPTIONAL]
-                Returns:
-                        Result object (str): Results which you can access with dot notation
-
-        """
-        return await self._fetch("news", category=category, limit=limit)
-
-    async def urban(self, query: str, limit: int = 10):
-        """
-        Returns An Object.
-
-                Parameters:
-                        query (str): Query to search
-                        limit (int): Limit the results [OPTIONAL]
-                Returns:
-                        Result object (str): Results which you can access with dot notation
-
-        """
-        return await self._fetch("urban", query=query, limit=limit)
-
-    async def unsplash(self, query: str, limit: int = 10):
-        """
-        Returns An Object.
-
-                Parameters:
-                        query (str): Query to search
-                        limit (int): Limit the results [OPTIONAL]
-                Returns:
-                        Result object (str): Results which you can access with dot notation
-
-        """
-        return await self._fetch("unsplash", query=query, limit=limit)
-
-    async def weather(self, city: str, type: str = "text"):
-        """
-        Returns An Object.
-
-                Parameters:
-                        city (str): Name of the city
-                        type (str): Type of result (text/image) [OPTIONAL]
-                Returns:
-                        Result object (str): Results which you can access with dot notation
-
-        """
-        return await self._fetch("weather", city=city, type=type)
-
-    async def dictionary(self, query: str, limit: int = 10):
-        """
-        Returns An Object.
-
-                Parameters:
-                        query (str): Query to search
-                        limit (int): Limit the results [OPTIONAL]
-                Returns:
-                        Result object (str): Results which you can access with dot notation
-
-        """
-        return await self._fetch("dictionary", query=query, limit=limit)
-
-    async def carbon(self, code: str, **kwargs):
-        """
-        Returns An Object.
-
-                Parameters:
-                        code (str): Code to make carbon
-                        kwagrs (dict): Extra args for styling
-                            - backgroundColor (str): Background color of carbon
-                            - fontFamily (str): Font family of carbon
-                            - fontSize (str): Font size of carbon
-                            - language (str): Language of carbon
-                            - theme (str): Theme of carbon
-                Returns:
-                        Result object (BytesIO): Results which you can access with filename
-
-        """
-        if "code" not in kwargs:
-            kwargs["code"] = code
-
-        return await self._post_json("carbon", json=kwargs)
-
-    async def rayso(self, code: str, **kwargs):
-        """
-        Returns An Object.
-
-                Parameters:
-                        code (str): Rayso content
-                        kwagrs (dict): Extra args for styling
-                            - title (str): Title of rayso
-                            - theme (str): Theme of rayso
-                            - padding (int): Padding of rayso
-                            - language (str): Language of rayso
-                            - darkMode (bool): Whether dark mode or not
-                Returns:
-                        Result object (BytesIO): Results which you can access with filename
-
-        """
-        if "code" not in kwargs:
-            kwargs["code"] = code
-
-        return await self._post_json("rayso", json=kwargs)
-
-    async def reddit(self, query: str, limit: int = 10, subreddit: list = [], nsfw: bool = False):
-        """
-        Returns An Object.
-
-                Parameters:
-                        query (str): Query to search
-                        limit (int): Limit the results [OPTIONAL]
-                        subreddit (list): Subreddits to include [OPTIONAL]
-                        nsfw (bool): Whether include adult content [OPTIONAL]
-                Returns:
-                        Result object (str): Results which you can access with dot notation
-
-        """
-        if isinstance(subreddit, list):
-            subreddit = ",".join(map(str, subreddit))
-        if isinstance(nsfw, bool):
-            nsfw = str(nsfw).lower()
-        return await self._fetch("reddit", query=query, limit=limit, subreddit=subreddit, nsfw=nsfw)
-
-    async def chatbot(self, query: str, user_id: int = 0, bot_name: str = "", bot_master: str = ""):
-        """
-        Returns An Object.
-
-                Parameters:
-                        query (str): Query to compute
-                        user_id (int): Unique user_id [OPTIONAL]
-                        bot_name (str): Your bot_name [OPTIONAL]
-                        bot_master (str): Developer name [OPTIONAL]
-                Returns:
-                        Result object (str): Results which you can access with dot notation
-        """
-        return await self._fetch("chatbot", query=query, user_id=user_id, bot_name=bot_name, bot_master=bot_master)
-
-    async def lyrics(self, title: str, artist: str = ""):
-        """
-        Returns An Object.
-
-                Parameters:
-                        title (str): Title of the song
-                        artist (str): Artist of the song [OPTIONAL]
-                Returns:
-                        Result object (str): Results which you can access with dot notation
-
-        """
-        return await self._fetch("lyrics", title=title, artist=artist)
-
-    async def wiki(self, query: str, limit: int = 10):
-        """
-        Returns An Object.
-
-                Parameters:
-                        query (str): Query to search
-                        limit (int): Limit the results [OPTIONAL]
-                Returns:
-                        Result object (str): Results which you can access with dot notation
-
-        """
-        return await self._fetch("wiki", query=query, limit=limit)
-
-    async def ipinfo(self, ip: str):
-        """
-        Returns An Object.
-
-                Parameters:
-                        ip (str): IP to search
-                Returns:
-                        Result object (str): Results which you can access with dot notation
-
-        """
-        return await self._fetch("ipinfo", ip=ip)
-
-    async def bininfo(self, bin: int):
-        """
-        Returns An Object.
-
-                Parameters:
-                        bin (int): Bin to search
-                Returns:
-                        Result object (str): Results which you can access with dot notation
-
-        """
-        return await self._fetch("bininfo", bin=bin)
-
-    async def covidinfo(self, country: str):
-        """
-        Returns An Object.
-
-                Parameters:
-                        country (str): Country name
-                Returns:
-                        Result object (str): Results which you can access with dot notation
-
-        """
-        return await self._fetch("covidinfo", country=country)
-
-    async def countryinfo(self, country: str):
-        """
-        Returns An Object.
-
-                Parameters:
-                        country (str): Country name
-                Returns:
-                        Result object (str): Results which you can access with dot notation
-
-        """
-        return await self._fetch("countryinfo", country=country)
-
-    async def fakeinfo(self, country: str = ""):
-        """
-        Returns An Object.
-
-                Parameters:
-                        country (str): Country code or iso [OPTIONAL]
-                Returns:
-                        Result object (str): Results which you can access with dot notation
-
-        """
-        return await self._fetch("fakeinfo", country=country)
-
-    async def acronym(self, word: str):
-        """
-        Returns An Object.
-
-                Parameters:
-                        word (str): Word to search
-                Returns:
-                        Result object (str): Results which you can access with dot notation
-
-        """
-        return await self._fetch("acronym", word=word)
-
-    async def recognize(self, image: str):
-        """
-        Returns An Object.
-
-                Parameters:
-                        image (str): Image url
-                Returns:
-                        Result object (str): Results which you can access with dot notation
-
-        """
-        return await self._fetch("recognize", image=image)
+        if nsfw:
+            return await self._fetch("anime/nsfw/" + type)
+        return await self._fetch("anime/sfw/" + type)
 
-    async def currency(self, origin: str, target: str, amount: int):
+    @with_deadline
+    async def carbon(self, code: str, **kwargs):
         """
         Returns An Object.
 
                 Parameters:
-                        origin (str): Origin of currency
-                        target (str): Targeted currency to convert
-                        amount (int): Amount of currency to convert
+                        code (str): Code to make carbon
+                        kwagrs (dict): Extra args for styling
+                            - backgroundColor (str): Background color of carbon
+                            - fontFamily (str): Font family of carbon
+                            - fontSize (str): Font size of carbon
+                            - language (str): Language of carbon
+                            - theme (str): Theme of carbon
+                        deadline (float): Seconds the call may take, retries and queueing included [OPTIONAL]
                 Returns:
-                        Result object (str): Results which you can access with dot notation
+                        Result object (BytesIO): Results which you can access with filename
 
         """
-        return await self._fetch("currency", origin=origin, target=target, amount=amount)
+        if "code" not in kwargs:
+            kwargs["code"] = code
+
+        return await self._post_json("carbon", json=kwargs)
 
-    async def tradingview(self, symbol: str, interval: str = "1h"):
+    @with_deadline
+    async def rayso(self, code: str, **kwargs):
         """
         Returns An Object.
 
                 Parameters:
-                        symbol (str): Crypto symbol to search
-                        interval (str): Interval of trading [OPTIONAL]
+                        code (str): Rayso content
+                        kwagrs (dict): Extra args for styling
+                            - title (str): Title of rayso
+                            - theme (str): Theme of rayso
+                            - padding (int): Padding of rayso
+                            - language (str): Language of rayso
+                            - darkMode (bool): Whether dark mode or not
+                        deadline (float): Seconds the call may take, retries and queueing included [OPTIONAL]
                 Returns:
-                        Result object (str): Results which you can access with dot notation
+                        Result object (BytesIO): Results which you can access with filename
 
         """
-        return await self._fetch("tradingview", symbol=symbol, interval=interval)
+        if "code" not in kwargs:
+            kwargs["code"] = code
+
+        return await self._post_json("rayso", json=kwargs)
 
-    async def spam_scan(self, message: Union[Message, str]):
+    @with_deadline
+    async def spam_scan(self, message: Union["Message", str]):
         """
         Returns An Object.
 
                 Parameters:
                         message (Union[Message, str]): Message to process
+                        deadline (float): Seconds the call may take, retries and queueing included [OPTIONAL]
                 Returns:
                         Result object (str): Results which you can access with dot notation
 
         """
-        if isinstance(message, Message):
-            message = message.text or message.caption or ""
+        if is_message(message):
+            message = message_text(message)
 
         if not message:
             raise InvalidRequest("Please provide a text or ~pyrogram.types.Message")
@@ -818,13 +628,15 @@ class SafoneAPI:
         json = dict(message=message)
         return await self._post_json("spam", json=json)
 
-    async def nsfw_scan(self, url: str = None, file: str = None):
+    @with_deadline
+    async def nsfw_scan(self, url: str = None, file: FileInput = None):
         """
         Returns An Object.
 
                 Parameters:
                         url (str): URL to scan [OPTIONAL]
-                        file (str): File path of an image to scan [OPTIONAL]
+                        file (FileInput): Path, file object, bytes or async byte iterator of an image to scan [OPTIONAL]
+                        deadline (float): Seconds the call may take, retries and queueing included [OPTIONAL]
                 Returns:
                         Result object (str): Results which you can access with dot notation
 
@@ -835,17 +647,17 @@ class SafoneAPI:
         if not file:
             return await self._fetch("nsfw", image=url)
 
-        async with aiofiles.open(file, mode="rb") as f:
-            file = await f.read()
-        return await self._post_data("nsfw", data={"image": file})
+        return await self._post_data("nsfw", data={"image": Upload(file)})
 
-    async def ocr_scan(self, url: str = None, file: str = None):
+    @with_deadline
+    async def ocr_scan(self, url: str = None, file: FileInput = None):
         """
         Returns An Object.
 
                 Parameters:
                         url (str): URL to scan [OPTIONAL]
-                        file (str): File path of an image to scan [OPTIONAL]
+                        file (FileInput): Path, file object, bytes or async byte iterator of an image to scan [OPTIONAL]
+                        deadline (float): Seconds the call may take, retries and queueing included [OPTIONAL]
                 Returns:
                         Result object (str): Results which you can access with dot notation
 
@@ -856,17 +668,17 @@ class SafoneAPI:
         if not file:
             return await self._fetch("ocr", image=url)
 
-        async with aiofiles.open(file, mode="rb") as f:
-            file = await f.read()
-        return await self._post_data("ocr", data={"image": file})
+        return await self._post_data("ocr", data={"image": Upload(file)})
 
-    async def removebg(self, url: str = None, file: str = None):
+    @with_deadline
+    async def removebg(self, url: str = None, file: FileInput = None):
         """
         Returns An Object.
 
                 Parameters:
                         url (str): URL to scan [OPTIONAL]
-                        file (str): File path of an image to scan [OPTIONAL]
+                        file (FileInput): Path, file object, bytes or async byte iterator of an image to scan [OPTIONAL]
+                        deadline (float): Seconds the call may take, retries and queueing included [OPTIONAL]
                 Returns:
                         Result object (BytesIO): Results which you can access with filename
 
@@ -877,24 +689,9 @@ class SafoneAPI:
         if not file:
             return await self._fetch("removebg", image=url)
 
-        async with aiofiles.open(file, mode="rb") as f:
-            file = await f.read()
-        return await self._post_data("removebg", data={"image": file})
-
-    async def proxy(self, type: str, country: str = "all", limit: int = 10):
-        """
-        Returns An Object.
-
-                Parameters:
-                        type (str): Type of proxy
-                        country (str): Country code [OPTIONAL]
-                        limit (int): Limit the results [OPTIONAL]
-                Returns:
-                        Result object (str): Results which you can access with dot notation
-
-        """
-        return await self._fetch("proxy/" + type, country=country, limit=limit)
+        return await self._post_data("removebg", data={"image": Upload(file)})
 
+    @with_deadline
     async def imdb(self, query: str = "", limit: int = 10, imdb_id: str = None):
         """
         Returns An Object.
@@ -903,6 +700,7 @@ class SafoneAPI:
                         query (str): Query to search
                         limit (int): Limit the results [OPTIONAL]
                         imdb_id (str): Specific IMDb ID [OPTIONAL]
+                        deadline (float): Seconds the call may take, retries and queueing included [OPTIONAL]
                 Returns:
                         Result object (str): Results which you can access with dot notation
 
@@ -912,6 +710,7 @@ class SafoneAPI:
 
         return await self._fetch("imdb", query=query, limit=limit, imdb_id=imdb_id)
 
+    @with_deadline
     async def tmdb(self, query: str = "", limit: int = 10, tmdb_id: int = 0):
         """
         Returns An Object.
@@ -920,6 +719,7 @@ class SafoneAPI:
                         query (str): Query to search
                         limit (int): Limit the results [OPTIONAL]
                         tmdb_id (int): Specific TMDb ID [OPTIONAL]
+                        deadline (float): Seconds the call may take, retries and queueing included [OPTIONAL]
                 Returns:
                         Result object (str): Results which you can access with dot notation
 
@@ -929,12 +729,14 @@ class SafoneAPI:
 
         return await self._fetch("tmdb", query=query, limit=limit, tmdb_id=tmdb_id)
 
-    async def quotly(self, messages: List[Message]):
+    @with_deadline
+    async def quotly(self, messages: List["Message"]):
         """
         Returns An Object.
 
                 Parameters:
                         messages (List[Message]): List of ~pyrogram.types.Message
+                        deadline (float): Seconds the call may take, retries and queueing included [OPTIONAL]
                 Returns:
                         Result object (BytesIO): Results which you can access with filename
 
@@ -1018,215 +820,7 @@ class SafoneAPI:
         }
         return await self._post_json("quotly", json=json)
 
-    async def figlet(self, text: str, font: str = ""):
-        """
-        Returns An Object.
-
-                Parameters:
-                        text (str): Some text
-                        font (str): Font name [OPTIONAL]
-                Returns:
-                        Result object (str): Results which you can access with dot notation
-
-        """
-        return await self._fetch("figlet", text=text, font=font)
-
-    async def pypi(self, query: str):
-        """
-        Returns An Object.
-
-                Parameters:
-                        query (str): Exact package name
-                Returns:
-                        Result object (str): Results which you can access with dot notation
-
-        """
-        return await self._fetch("pypi", query=query)
-
-    async def image(self, query: str, limit: int = 10):
-        """
-        Returns An Object.
-
-                Parameters:
-                        query (str): Query to search
-                        limit (int): Limit the results [OPTIONAL]
-                Returns:
-                        Result object (str): Results which you can access with dot notation
-
-        """
-        return await self._fetch("image", query=query, limit=limit)
-
-    async def qrcode(self, text: str):
-        """
-        Returns An Object.
-
-                Parameters:
-                        text (str): Some text
-                Returns:
-                        Result object (BytesIO): Results which you can access with filename
-
-        """
-        return await self._fetch("qrcode", text=text)
-
-    async def shortlink(self, url: str, domain: str = ""):
-        """
-        Returns An Object.
-
-                Parameters:
-                        url (str): Long url
-                        domain (str): Domain [OPTIONAL]
-                Returns:
-                        Result object (str): Results which you can access with dot notation
-
-        """
-        return await self._fetch("shortlink", url=url, domain=domain)
-
-    async def bypasslink(self, url: str, domain: str = ""):
-        """
-        Returns An Object.
-
-                Parameters:
-                        url (str): Short url
-                        domain (str): Domain [OPTIONAL]
-                Returns:
-                        Result object (str): Results which you can access with dot notation
-
-        """
-        return await self._fetch("bypasslink", url=url, domain=domain)
-
-    async def ccgen(self, bins: List[Union[str, int]], limit: int = 10):
-        """
-        Returns An Object.
-
-                Parameters:
-                        bins (List[Union[str, int]]): List of bins
-                        limit (int): Limit the number of cards [OPTIONAL]
-                Returns:
-                        Result object (str): Results which you can access with dot notation
-
-        """
-        if isinstance(bins, list):
-            bins = ",".join(map(str, bins))
-
-        return await self._fetch("ccgen", bins=bins, limit=limit)
-
-    async def subtitle(self, query: str, limit: int = 10, language: str = "all"):
-        """
-        Returns An Object.
-
-                Parameters:
-                        query (str): Query to search
-                        limit (int): Limit the results [OPTIONAL]
-                        language (str): Language of subtitle [OPTIONAL]
-                Returns:
-                        Result object (str): Results which you can access with dot notation
-
-        """
-        return await self._fetch("subtitle", query=query, limit=limit, language=language)
-
-    async def skcheck(self, key: str):
-        """
-        Returns An Object.
-
-                Parameters:
-                        key (str): Stripe key
-                Returns:
-                        Result object (str): Results which you can access with dot notation
-
-        """
-        return await self._fetch("skcheck", key=key)
-
-    async def spellcheck(self, text: str):
-        """
-        Returns An Object.
-
-                Parameters:
-                        text (str): Some text
-                Returns:
-                        Result object (str): Results which you can access with dot notation
-
-        """
-        return await self._fetch("spellcheck", text=text)
-
-    async def paraphrase(self, text: str, creativity: int = 2):
-        """
-        Returns An Object.
-
-                Parameters:
-                        text (str): Some text
-                        creativity (int): Creativity level (1-3) [OPTIONAL]
-                Returns:
-                        Result object (str): Results which you can access with dot notation
-
-        """
-        json = dict(text=text, creativity=creativity)
-        return await self._post_json("paraphrase", json=json)
-
-    async def grammarly(self, text: str):
-        """
-        Returns An Object.
-
-                Parameters:
-                        text (str): Some text
-                Returns:
-                        Result object (str): Results which you can access with dot notation
-
-        """
-        json = dict(text=text)
-        return await self._post_json("grammarly", json=json)
-
-    async def tgsticker(self, query: str, limit: int = 10):
-        """
-        Returns An Object.
-
-                Parameters:
-                        query (str): Query to search
-                        limit (int): Limit the results [OPTIONAL]
-                Returns:
-                        Result object (str): Results which you can access with dot notation
-
-        """
-        return await self._fetch("tgsticker", query=query, limit=limit)
-
-    async def torrent(self, query: str, limit: int = 10):
-        """
-        Returns An Object.
-
-                Parameters:
-                        query (str): Query to search
-                        limit (int): Limit the results [OPTIONAL]
-                Returns:
-                        Result object (str): Results which you can access with dot notation
-
-        """
-        return await self._fetch("torrent", query=query, limit=limit)
-
-    async def stackoverflow(self, query: str, limit: int = 10):
-        """
-        Returns An Object.
-
-                Parameters:
-                        query (str): Query to search
-                        limit (int): Limit the results [OPTIONAL]
-                Returns:
-                        Result object (str): Results which you can access with dot notation
-
-        """
-        return await self._fetch("stackoverflow", query=query, limit=limit)
-
-    async def spotify(self, query: str, limit: int = 10):
-        """
-        Returns An Object.
-
-                Parameters:
-                        query (str): Query to search
-                        limit (int): Limit the results [OPTIONAL]
-                Returns:
-                        Result object (str): Results which you can access with dot notation
-
-        """
-        return await self._fetch("spotify", query=query, limit=limit)
-
+    @with_deadline
     async def speech(self, text: str, character: str = None):
         """
         Returns An Object.
@@ -1234,6 +828,7 @@ class SafoneAPI:
                 Parameters:
                         text (str): Text to speech
                         character (str): Character name [OPTIONAL]
+                        deadline (float): Seconds the call may take, retries and queueing included [OPTIONAL]
                 Returns:
                         Result object (BytesIO): Results which you can access with filename
 
@@ -1244,67 +839,7 @@ class SafoneAPI:
         json = dict(text=text, character=character)
         return await self._post_json("speech", json=json)
 
-    async def translate(self, text: str, source: str = "auto", target: str = "en"):
-        """
-        Returns An Object.
-
-                Parameters:
-                        text (str): Text to translate
-                        source (str): Language code of source language [OPTIONAL]
-                        target (str): Language code of target language [OPTIONAL]
-                Returns:
-                        Result object (str): Results which you can access with dot notation
-
-        """
-        json = dict(
-                text=text,
-                source=source,
-                target=target,
-            )
-        return await self._post_json("translate", json=json)
-
-    async def paste(self, content: str, title: str = None, language: str = None, ephemeral: bool = False):
-        """
-        Returns An Object.
-
-                Parameters:
-                        content (str): Text content to paste
-                        title (str): Title of the page [OPTIONAL]
-                        language (str): Language for highlight [OPTIONAL]
-                        ephemeral (bool): Whether one-time view [OPTIONAL]
-                Returns:
-                        Result object (str): Results which you can access with dot notation
-
-        """
-        json = dict(
-                content=content,
-                title=title,
-                language=language,
-                ephemeral=ephemeral,
-            )
-        return await self._post_json("paste", json=json)
-
-    async def write(self, text: str, page: str = None, font: str = None, color: str = "black"):
-        """
-        Returns An Object.
-
-                Parameters:
-                        text (str): Text to write
-                        page (str): Page name [OPTIONAL]
-                        font (str): Font name [OPTIONAL]
-                        color (str): Color of text [OPTIONAL]
-                Returns:
-                        Result object (List[BytesIO]): Results which you can access with filename
-
-        """
-        json = dict(
-                text=text,
-                page=page,
-                font=font,
-                color=color,
-            )
-        return await self._post_json("write", json=json)
-
+    @with_deadline
     async def execute(self, language: str = None, code: str = None, stdin: str = "", args: list = []):
         """
         Returns An Object.
@@ -1314,6 +849,7 @@ class SafoneAPI:
                         code (str): Code to execute [OPTIONAL]
                         stdin (str): STDIN for the code [OPTIONAL]
                         args (list): arguments to pass in cli [OPTIONAL]
+                        deadline (float): Seconds the call may take, retries and queueing included [OPTIONAL]
                 Returns:
                         Result object:
                             result.output, result.output `if language is passed`,
@@ -1331,7 +867,8 @@ class SafoneAPI:
             )
         return await self._post_json("execute", json=json)
 
-    async def gemini(self, message: Union[Message, str], chat_mode: str = None, dialog_messages: list = []):
+    @with_deadline
+    async def gemini(self, message: Union["Message", str], chat_mode: str = None, dialog_messages: list = []):
         """
         Returns An Object.
 
@@ -1339,14 +876,15 @@ class SafoneAPI:
                         message (Union[Message, str]): ~pyrogram.types.Message or text
                         chat_mode (str): Modes like 'assistant', 'code_assistant' etc [OPTIONAL]
                         dialog_messages (list): List of chat messages as dict(user, bot) [OPTIONAL]
+                        deadline (float): Seconds the call may take, retries and queueing included [OPTIONAL]
                 Returns:
                         Result object (str): Results which you can access with dot notation
     
             """
         formated_messages = []
 
-        if isinstance(message, Message):
-            if message.command:
+        if is_message(message):
+            if getattr(message, "command", None):
                 message = " ".join(message.command[1:])
             elif message.text:
                 message = message.text.strip()
@@ -1355,7 +893,7 @@ class SafoneAPI:
 
         for dialog_message in dialog_messages:
             if (
-                isinstance(dialog_message, Message)
+                is_message(dialog_message)
                 and dialog_message.from_user and dialog_message.text
             ):
                 k = "bot" if dialog_message.from_user.is_bot else "user"
@@ -1373,7 +911,8 @@ class SafoneAPI:
             )
         return await self._post_json("gemini", json=json)
 
-    async def llama(self, message: Union[Message, str], chat_mode: str = None, dialog_messages: list = []):
+    @with_deadline
+    async def llama(self, message: Union["Message", str], chat_mode: str = None, dialog_messages: list = []):
         """
         Returns An Object.
 
@@ -1381,14 +920,15 @@ class SafoneAPI:
                         message (Union[Message, str]): ~pyrogram.types.Message or text
                         chat_mode (str): Modes like 'assistant', 'code_assistant' etc [OPTIONAL]
                         dialog_messages (list): List of chat messages as dict(user, bot) [OPTIONAL]
+                        deadline (float): Seconds the call may take, retries and queueing included [OPTIONAL]
                 Returns:
                         Result object (str): Results which you can access with dot notation
     
             """
         formated_messages = []
 
-        if isinstance(message, Message):
-            if message.command:
+        if is_message(message):
+            if getattr(message, "command", None):
                 message = " ".join(message.command[1:])
             elif message.text:
                 message = message.text.strip()
@@ -1397,7 +937,7 @@ class SafoneAPI:
 
         for dialog_message in dialog_messages:
             if (
-                isinstance(dialog_message, Message)
+                is_message(dialog_message)
                 and dialog_message.from_user and dialog_message.text
             ):
                 k = "bot" if dialog_message.from_user.is_bot else "user"
@@ -1415,22 +955,7 @@ class SafoneAPI:
             )
         return await self._post_json("llama", json=json)
 
-    async def logo(self, text: str, color: str = "", keyword: str = "", limit: int = 10, version: int = 1):
-        """
-        Returns An Object.
-
-                Parameters:
-                        text (str): Text to make logo
-                        color (str): Logo text color [OPTIONAL]
-                        keyword (str): Logo keywords [OPTIONAL]
-                        limit (int): Limit the results [OPTIONAL]
-                        version (int): Version of logo [OPTIONAL]
-                Returns:
-                        Result object (BytesIO): Results which you can access with filename
-
-        """
-        return await self._fetch("logo", text=text, color=color, keyword=keyword, limit=limit, version=version)
-
+    @with_deadline
     async def imagine(self, prompt: str, model: str = "", limit: int = 1, version: int = 1, nsfw: bool = False):
         """
         Returns An Object.
@@ -1441,6 +966,7 @@ class SafoneAPI:
                         limit (int): Limit the results [OPTIONAL]
                         version (int): Version of imagine [OPTIONAL]
                         nsfw (bool): Whether include adult content [OPTIONAL]
+                        deadline (float): Seconds the call may take, retries and queueing included [OPTIONAL]
                 Returns:
                         Result object (List[BytesIO]): Results which you can access with filename
 
@@ -1449,33 +975,8 @@ class SafoneAPI:
             return await self._fetch("imagine/nsfw", prompt=prompt, model=model, limit=limit)
         return await self._fetch("imagine", prompt=prompt, limit=limit, version=version)
 
-    async def webshot(self, url: str, width: int = 1920, height: int = 1080, delay: float = 0.1, full: bool = False):
-        """
-        Returns An Object.
-
-                Parameters:
-                        url (str): The website url with http
-                        width (int): Width of webshot [OPTIONAL]
-                        height (int): Height of webshot [OPTIONAL]
-                        delay (float): Delay in seconds [OPTIONAL]
-                        full (bool): Whether capture full page [OPTIONAL]
-                Returns:
-                        Result object (BytesIO): Results which you can access with filename
-
-        """
-        if not url.startswith("http"):
-            url = "http://" + url
-
-        json = dict(
-                url=url,
-                width=width,
-                height=height,
-                delay=delay,
-                full=full,
-            )
-        return await self._post_json("webshot", json=json)
-
-    async def chatgpt(self, message: Union[Message, str], chat_mode: str = None, dialog_messages: list = [], version: int = 3):
+    @with_deadline
+    async def chatgpt(self, message: Union["Message", str], chat_mode: str = None, dialog_messages: list = [], version: int = 3):
         """
         Returns An Object.
 
@@ -1484,14 +985,15 @@ class SafoneAPI:
                         chat_mode (str): Modes like 'assistant', 'code_assistant' etc [OPTIONAL]
                         dialog_messages (list): List of chat messages as dict(user, bot) [OPTIONAL]
                         version (int): The GPT model version (3 = gpt-3.5 and 4 = gpt-4) [OPTIONAL]
+                        deadline (float): Seconds the call may take, retries and queueing included [OPTIONAL]
                 Returns:
                         Result object (str): Results which you can access with dot notation
 
         """
         formated_messages = []
 
-        if isinstance(message, Message):
-            if message.command:
+        if is_message(message):
+            if getattr(message, "command", None):
                 message = " ".join(message.command[1:])
             elif message.text:
                 message = message.text.strip()
@@ -1500,7 +1002,7 @@ class SafoneAPI:
 
         for dialog_message in dialog_messages:
             if (
-                isinstance(dialog_message, Message)
+                is_message(dialog_message)
                 and dialog_message.from_user and dialog_message.text
             ):
                 k = "bot" if dialog_message.from_user.is_bot else "user"
@@ -1519,16 +1021,18 @@ class SafoneAPI:
             )
         return await self._post_json("chatgpt", json=json)
 
-    async def telegraph(self, file: str = None, title: str = None, content: str = None, author_name: str = None, author_url: str = None):
+    @with_deadline
+    async def telegraph(self, file: FileInput = None, title: str = None, content: str = None, author_name: str = None, author_url: str = None):
         """
         Returns An Object.
 
                 Parameters:
-                        file (str): File path of a media [OPTIONAL]
+                        file (FileInput): Path, file object, bytes or async byte iterator of a media [OPTIONAL]
                         title (str): Page title [OPTIONAL]
                         content (str): Page content [OPTIONAL]
                         author_name (str): Page author name [OPTIONAL]
                         author_url (str): Page author url [OPTIONAL]
+                        deadline (float): Seconds the call may take, retries and queueing included [OPTIONAL]
                 Returns:
                         Result object (str): Results which you can access with dot notation
 
@@ -1545,6 +1049,4 @@ class SafoneAPI:
             )
             return await self._post_json("telegraph/text", json=json)
 
-        async with aiofiles.open(file, mode="rb") as f:
-            file = await f.read()
-        return await self._post_data("telegraph/media", data={"media": file})
+        return await self._post_data("telegraph/media", data={"media": Upload(file)})
@@ -0,0 +1,94 @@
+"""
+SafoneAPI v1.0
+Copyright (c) 2025 AsmSafone
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import asyncio
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterable, Tuple
+
+from .errors import BaseError
+
+_DONE = object()
+
+
+async def _call(func: Callable[..., Awaitable], item: Any) -> Any:
+    try:
+        if isinstance(item, tuple):
+            return await func(*item)
+        if isinstance(item, dict):
+            return await func(**item)
+        return await func(item)
+    except BaseError as error:
+        return error
+
+
+async def map_calls(
+    func: Callable[..., Awaitable],
+    items: Iterable,
+    concurrency: int = 10,
+    ordered: bool = True,
+) -> AsyncIterator[Tuple[int, Any]]:
+    """
+    Calls `func` once per item with at most `concurrency` calls in flight,
+    yielding `(index, result)` pairs in input order or as they complete.
+
+    A tuple item is passed as positional arguments, a dict as keyword
+    arguments and anything else as the single argument. Errors from
+    `errors.py` are yielded in place of the result instead of stopping
+    the batch, while any other exception cancels the remaining calls.
+    Calls still in flight are cancelled when the iterator is closed, so
+    close it (e.g. with `contextlib.aclosing`) when breaking out early.
+    """
+    source = iter(enumerate(items))
+    queue = asyncio.Queue()
+
+    async def worker():
+        try:
+            for index, item in source:
+                await queue.put((index, await _call(func, item)))
+        except Exception as error:
+            await queue.put((None, error))
+            return
+        await queue.put((None, _DONE))
+
+    workers = [asyncio.ensure_future(worker()) for _ in range(max(1, concurrency))]
+    running = len(workers)
+    pending = {}
+    expected = 0
+    try:
+        while running:
+            index, result = await queue.get()
+            if index is None:
+                if result is not _DONE:
+                    raise result
+                running -= 1
+                continue
+            if not ordered:
+                yield index, result
+                continue
+            pending[index] = result
+            while expected in pending:
+                yield expected, pending.pop(expected)
+                expected += 1
+    finally:
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
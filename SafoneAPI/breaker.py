@@ -0,0 +1,206 @@
+"""
+SafoneAPI v1.0
+Copyright (c) 2025 AsmSafone
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import time
+from collections import deque
+from typing import Callable, Dict, Optional, Tuple, Type
+
+from .errors import BaseError, CircuitOpen, DeadlineExceeded, TimeoutError, ConnectionError
+from .endpoints import route_key
+from .middleware import Handler, Middleware, Request, Response
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half-open"
+
+
+class Circuit:
+    """
+    The health of a single route.
+
+    Attributes:
+        state (str): One of `closed`, `open` or `half-open`.
+        outcomes (deque): Whether each of the last calls failed.
+        failures (int): Number of failed calls in `outcomes`.
+        opened_at (float): Monotonic time the circuit last opened.
+        probes (int): Trial calls in flight while half-open.
+        passed (int): Successful trial calls since the circuit became half-open.
+    """
+
+    __slots__ = ("state", "outcomes", "failures", "opened_at", "probes", "passed")
+
+    def __init__(self, window: int):
+        self.state = CLOSED
+        self.outcomes = deque(maxlen=window)
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probes = 0
+        self.passed = 0
+
+    @property
+    def failure_ratio(self) -> float:
+        return self.failures / len(self.outcomes) if self.outcomes else 0.0
+
+    def record(self, failed: bool):
+        if len(self.outcomes) == self.outcomes.maxlen:
+            self.failures -= self.outcomes[0]
+        self.outcomes.append(failed)
+        self.failures += failed
+
+    def reset(self):
+        self.outcomes.clear()
+        self.failures = 0
+
+
+class CircuitBreaker(Middleware):
+    """
+    Fails calls to an unhealthy route immediately instead of waiting for timeouts.
+
+    Each route has its own circuit. It opens once at least `min_calls`
+    of the last `window` calls were made and `failure_ratio` of them
+    failed with one of `failures`, by default timeouts and connection
+    errors, which include `502` and `503` answers. Calls cut short by
+    their own deadline do not count. While open every call raises
+    CircuitOpen without reaching the server. After `reset_timeout`
+    seconds the circuit is half-open and lets `trial_calls` probes
+    through, closing again once they all succeeded and reopening on the
+    first failure.
+
+    Args:
+        failure_ratio (float): Share of failed calls which opens the circuit.
+        window (int): Number of recent calls the ratio is computed over.
+        min_calls (int): Calls needed in the window before the circuit can open.
+        reset_timeout (float): Seconds an open circuit waits before probing.
+        trial_calls (int): Successful probes needed to close the circuit.
+        failures (Tuple[Type[BaseError]]): Errors which count as a failure.
+        on_change (Callable[[str, str, str], None]): Called with the route, old and new state on every transition.
+    """
+
+    def __init__(
+        self,
+        failure_ratio: float = 0.5,
+        window: int = 20,
+        min_calls: int = 10,
+        reset_timeout: float = 30,
+        trial_calls: int = 3,
+        failures: Tuple[Type[BaseError], ...] = (TimeoutError, ConnectionError),
+        on_change: Optional[Callable[[str, str, str], None]] = None,
+    ):
+        self.failure_ratio = failure_ratio
+        self.window = window
+        self.min_calls = min_calls
+        self.reset_timeout = reset_timeout
+        self.trial_calls = trial_calls
+        self.failures = failures
+        self.on_change = on_change
+        self.circuits: Dict[str, Circuit] = {}
+
+    def state(self, route: str) -> str:
+        """
+        Returns the current state of a route, `half-open` once its open period is over.
+        Reading it never changes the circuit, which only moves on the next call.
+        """
+        circuit = self.circuits.get(route_key(route))
+        if circuit is None:
+            return CLOSED
+        return self._effective(circuit)
+
+    def states(self) -> Dict[str, dict]:
+        """
+        Returns the state, failure ratio and call count of every route seen so far.
+        """
+        return {
+            route: {
+                "state": self._effective(circuit),
+                "failure_ratio": circuit.failure_ratio,
+                "calls": len(circuit.outcomes),
+            }
+            for route, circuit in list(self.circuits.items())
+        }
+
+    def _transition(self, route: str, circuit: Circuit, state: str):
+        old, circuit.state = circuit.state, state
+        if state == OPEN:
+            circuit.opened_at = time.monotonic()
+        elif state == HALF_OPEN:
+            circuit.probes = circuit.passed = 0
+        else:
+            circuit.reset()
+        if self.on_change:
+            self.on_change(route, old, state)
+
+    def _effective(self, circuit: Circuit) -> str:
+        if circuit.state == OPEN and time.monotonic() - circuit.opened_at >= self.reset_timeout:
+            return HALF_OPEN
+        return circuit.state
+
+    def _expire(self, route: str, circuit: Circuit):
+        if circuit.state == OPEN and self._effective(circuit) == HALF_OPEN:
+            self._transition(route, circuit, HALF_OPEN)
+
+    def _reject(self, route: str, circuit: Circuit):
+        wait = max(0.0, self.reset_timeout - (time.monotonic() - circuit.opened_at))
+        raise CircuitOpen(f"Service Unavailable, The route {route} is failing, Please try again in {wait:.0f}s")
+
+    async def __call__(self, request: Request, handler: Handler) -> Response:
+        route = route_key(request.route)
+        circuit = self.circuits.get(route)
+        if circuit is None:
+            circuit = self.circuits[route] = Circuit(self.window)
+        self._expire(route, circuit)
+        if circuit.state == OPEN:
+            self._reject(route, circuit)
+        probe = circuit.state == HALF_OPEN
+        if probe:
+            if circuit.probes >= self.trial_calls:
+                self._reject(route, circuit)
+            circuit.probes += 1
+        try:
+            response = await handler(request)
+        except DeadlineExceeded:
+            if probe:
+                circuit.probes = max(0, circuit.probes - 1)
+            raise
+        except self.failures:
+            if probe:
+                circuit.probes = max(0, circuit.probes - 1)
+                if circuit.state == HALF_OPEN:
+                    self._transition(route, circuit, OPEN)
+            elif circuit.state == CLOSED:
+                circuit.record(True)
+                if len(circuit.outcomes) >= self.min_calls and circuit.failure_ratio >= self.failure_ratio:
+                    self._transition(route, circuit, OPEN)
+            raise
+        except BaseException:
+            if probe:
+                circuit.probes = max(0, circuit.probes - 1)
+            raise
+        if probe:
+            circuit.probes = max(0, circuit.probes - 1)
+            if circuit.state == HALF_OPEN:
+                circuit.passed += 1
+                if circuit.passed >= self.trial_calls:
+                    self._transition(route, circuit, CLOSED)
+        elif circuit.state == CLOSED:
+            circuit.record(False)
+        return response
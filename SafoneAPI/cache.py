@@ -0,0 +1,252 @@
+"""
+SafoneAPI v1.0
+Copyright (c) 2025 AsmSafone
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import json
+import time
+import zlib
+import asyncio
+from base64 import b64encode
+from functools import partial
+from collections import OrderedDict
+from typing import Dict, Iterable, Optional
+
+from .endpoints import DEFAULT_TTLS, RANDOM_ROUTES
+from .middleware import Handler, Middleware, Request, Response, match_route
+from .sqlite import SQLiteConnection
+
+
+def _encode_bytes(value):
+    if isinstance(value, bytes):
+        return b64encode(value).decode()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class MemoryCache:
+    """
+    An in-process LRU cache bounded by entry count and total response size.
+
+    Args:
+        max_entries (int): Maximum number of cached responses.
+        max_bytes (int): Maximum total size of the cached response bodies.
+    """
+
+    def __init__(self, max_entries: int = 1024, max_bytes: int = 64 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    async def get(self, key: tuple) -> Optional[Response]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires, response = entry
+        if expires <= time.monotonic():
+            self._remove(key)
+            return None
+        self._entries.move_to_end(key)
+        return response
+
+    async def set(self, key: tuple, response: Response, ttl: float):
+        if response.size > self.max_bytes:
+            return
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = (time.monotonic() + ttl, response)
+        self.size += response.size
+        while len(self._entries) > self.max_entries or self.size > self.max_bytes:
+            self._remove(next(iter(self._entries)))
+
+    async def clear(self):
+        self._entries.clear()
+        self.size = 0
+
+    def _remove(self, key: tuple):
+        _, response = self._entries.pop(key)
+        self.size -= response.size
+
+
+class SQLiteCache:
+    """
+    A persistent cache stored in a SQLite database, shared by every process using the same file.
+
+    The database runs in WAL mode so readers never block the writer, and
+    bodies are stored zlib compressed. Entries are evicted when they expire,
+    when they are older than `max_age`, or least recently used first once
+    the total size exceeds `max_bytes`. Queries run in the default executor
+    so the event loop is never blocked on disk. The connection is reopened
+    after a fork, so a cache created before the workers fork can be shared
+    by all of them.
+
+    Args:
+        path (str): Path of the database file.
+        max_bytes (int): Maximum total size of the stored (compressed) bodies.
+        max_age (float): Maximum age of an entry in seconds, regardless of its ttl.
+    """
+
+    def __init__(self, path: str, max_bytes: int = 256 * 1024 * 1024, max_age: float = 7 * 86400):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self._db = SQLiteConnection(path, (
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, status INTEGER, body BLOB, size INTEGER, "
+            "raw_size INTEGER, expires REAL, accessed REAL)",
+            "CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)",
+        ))
+        self._lock = self._db.lock
+        with self._lock:
+            self._db.connect()
+
+    def __len__(self):
+        with self._lock:
+            db = self._db.connect()
+            return db.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    async def _run(self, func, *args):
+        return await asyncio.get_running_loop().run_in_executor(None, partial(func, *args))
+
+    async def get(self, key: tuple) -> Optional[Response]:
+        return await self._run(self._get, json.dumps(key))
+
+    async def set(self, key: tuple, response: Response, ttl: float):
+        await self._run(self._set, json.dumps(key), response, min(ttl, self.max_age))
+
+    async def clear(self):
+        await self._run(self._execute, "DELETE FROM responses")
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+    def _execute(self, query: str, *args):
+        with self._lock:
+            db = self._db.connect()
+            return db.execute(query, args).fetchall()
+
+    def _get(self, key: str) -> Optional[Response]:
+        now = time.time()
+        with self._lock:
+            db = self._db.connect()
+            row = db.execute(
+                "SELECT status, body, raw_size FROM responses WHERE key = ? AND expires > ?", (key, now)
+            ).fetchone()
+            if row is None:
+                return None
+            db.execute("UPDATE responses SET accessed = ? WHERE key = ?", (now, key))
+        status, body, raw_size = row
+        return Response(status, None, json.loads(zlib.decompress(body)), raw_size)
+
+    def _set(self, key: str, response: Response, ttl: float):
+        body = zlib.compress(json.dumps(response.data, separators=(",", ":"), default=_encode_bytes).encode())
+        if len(body) > self.max_bytes:
+            return
+        now = time.time()
+        with self._lock:
+            db = self._db.connect()
+            db.execute("BEGIN IMMEDIATE")
+            try:
+                db.execute(
+                    "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (key, response.status, body, len(body), response.size, now + ttl, now),
+                )
+                db.execute("DELETE FROM responses WHERE expires <= ?", (now,))
+                total = db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+                if total > self.max_bytes:
+                    for old_key, size in db.execute(
+                        "SELECT key, size FROM responses ORDER BY accessed"
+                    ).fetchall():
+                        if total <= self.max_bytes:
+                            break
+                        db.execute("DELETE FROM responses WHERE key = ?", (old_key,))
+                        total -= size
+                db.execute("COMMIT")
+            except BaseException:
+                db.execute("ROLLBACK")
+                raise
+
+
+class ResponseCache(Middleware):
+    """
+    Serves repeated `GET` calls from a cache backend.
+
+    Each route is cached for the ttl found in `routes` (falling back to
+    parent routes) or `ttl` otherwise, and a ttl of 0 disables caching.
+    Random endpoints are never cached.
+
+    Args:
+        backend (Union[MemoryCache, SQLiteCache]): Where responses are stored, an in-memory LRU by default.
+        ttl (float): Seconds to cache routes not listed in `routes`.
+        routes (Dict[str, float]): Seconds to cache each route.
+        exclude (Iterable[str]): Routes which are never cached.
+
+    Attributes:
+        hits (int): Calls answered from the cache.
+        misses (int): Cacheable calls which went to the network.
+    """
+
+    def __init__(
+        self,
+        backend=None,
+        ttl: float = 0,
+        routes: Dict[str, float] = None,
+        exclude: Iterable[str] = RANDOM_ROUTES,
+    ):
+        self.backend = backend if backend is not None else MemoryCache()
+        self.ttl = ttl
+        self.routes = DEFAULT_TTLS if routes is None else routes
+        self.exclude = dict.fromkeys(exclude, True)
+        self.hits = 0
+        self.misses = 0
+
+    def ttl_for(self, request: Request) -> float:
+        if request.method != "GET" or match_route(self.exclude, request.route):
+            return 0
+        return match_route(self.routes, request.route, self.ttl)
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "ratio": self.hits / total if total else 0.0,
+        }
+
+    async def __call__(self, request: Request, handler: Handler) -> Response:
+        ttl = self.ttl_for(request)
+        if not ttl:
+            return await handler(request)
+        key = request.key
+        response = await self.backend.get(key)
+        if response is not None:
+            self.hits += 1
+            request.context["cache_hit"] = True
+            return response
+        self.misses += 1
+        request.context["cache_hit"] = False
+        response = await handler(request)
+        await self.backend.set(key, response, ttl)
+        return response
@@ -0,0 +1,82 @@
+"""
+SafoneAPI v1.0
+Copyright (c) 2025 AsmSafone
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import asyncio
+from typing import Dict, Iterable
+
+from .endpoints import RANDOM_ROUTES
+from .middleware import Handler, Middleware, Request, Response, match_route
+
+
+class _Flight:
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: asyncio.Future):
+        self.task = task
+        self.waiters = 0
+
+
+class Coalescer(Middleware):
+    """
+    Shares one upstream call between identical concurrent `GET` calls.
+
+    Calls with the same route and params made while a previous one is
+    still in flight wait for its response instead of sending their own.
+    The shared call runs as its own task, so a cancelled waiter, the
+    first one included, leaves it running for the others. It is only
+    cancelled once every waiter is gone.
+
+    Args:
+        exclude (Iterable[str]): Routes which are never coalesced, random endpoints by default.
+    """
+
+    def __init__(self, exclude: Iterable[str] = RANDOM_ROUTES):
+        self.exclude = dict.fromkeys(exclude, True)
+        self.flights: Dict[tuple, _Flight] = {}
+
+    @property
+    def in_flight(self) -> int:
+        return len(self.flights)
+
+    async def __call__(self, request: Request, handler: Handler) -> Response:
+        if request.method != "GET" or match_route(self.exclude, request.route):
+            return await handler(request)
+        key = request.key
+        flight = self.flights.get(key)
+        if flight is None:
+            flight = self.flights[key] = _Flight(asyncio.ensure_future(handler(request)))
+            flight.task.add_done_callback(lambda _: self._land(key, flight))
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)
+        except asyncio.CancelledError:
+            if flight.waiters == 1 and not flight.task.done():
+                self._land(key, flight)
+                flight.task.cancel()
+            raise
+        finally:
+            flight.waiters -= 1
+
+    def _land(self, key: tuple, flight: _Flight):
+        if self.flights.get(key) is flight:
+            del self.flights[key]
@@ -0,0 +1,539 @@
+"""
+SafoneAPI v1.0
+Copyright (c) 2025 AsmSafone
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import string
+import inspect
+import functools
+from typing import Any, Callable, Dict, List, Sequence, Tuple, Union
+
+from .middleware import match_route
+from .timeouts import LONG, SHORT, Timeout, deadline
+
+REQUIRED = inspect.Parameter.empty
+
+HOUR = 60 * 60
+DAY = 24 * HOUR
+
+_RETURNS = {
+    None: "Result object (str): Results which you can access with dot notation",
+    "image": "Result object (BytesIO): Results which you can access with filename",
+    "audio": "Result object (BytesIO): Results which you can access with filename",
+    "images": "Result object (List[BytesIO]): Results which you can access with filename",
+}
+
+
+def join_list(value: Any) -> Any:
+    """
+    Sends a list as comma separated values.
+    """
+    return ",".join(map(str, value)) if isinstance(value, list) else value
+
+
+def lower_bool(value: Any) -> Any:
+    """
+    Sends a bool as `true` or `false`, which query strings can carry.
+    """
+    return str(value).lower() if isinstance(value, bool) else value
+
+
+def http_url(value: Any) -> Any:
+    """
+    Adds a missing scheme to an url.
+    """
+    return value if value.startswith("http") else "http://" + value
+
+
+class Param:
+    """
+    A single argument of an endpoint.
+
+    Args:
+        name (str): Name of the argument and of the field sent to the api.
+        annotation (type): Type of the argument, for the signature and the docstring.
+        doc (str): Description of the argument.
+        default (Any): Default value, `REQUIRED` for a mandatory argument.
+        normalize (Callable[[Any], Any]): Converts the value before it is sent.
+    """
+
+    __slots__ = ("name", "annotation", "doc", "default", "normalize")
+
+    def __init__(
+        self,
+        name: str,
+        annotation: Any,
+        doc: str,
+        default: Any = REQUIRED,
+        normalize: Callable[[Any], Any] = None,
+    ):
+        self.name = name
+        self.annotation = annotation
+        self.doc = doc
+        self.default = default
+        self.normalize = normalize
+
+    @property
+    def type_name(self) -> str:
+        if isinstance(self.annotation, type):
+            return self.annotation.__name__
+        return str(self.annotation).replace("typing.", "")
+
+    def parameter(self) -> inspect.Parameter:
+        return inspect.Parameter(
+            self.name,
+            inspect.Parameter.POSITIONAL_OR_KEYWORD,
+            default=self.default,
+            annotation=self.annotation,
+        )
+
+
+DEADLINE = Param("deadline", float, "Seconds the call may take, retries and queueing included", None)
+
+
+class Endpoint:
+    """
+    Description of an api route and the policy calls to it follow.
+
+    Endpoints with a `name` become a method of SafoneAPI, the others only
+    describe routes served by hand-written methods. Placeholders in the
+    route, like `{type}` in `udemy/{type}`, are filled from the arguments
+    of the same name and the rest is sent as query string for `GET` or as
+    json body otherwise. Per-route settings apply to every route starting
+    with `key`, the route up to its first placeholder.
+
+    Args:
+        route (str): The api route, relative to the base url.
+        name (str): Name of the generated method, None for hand-written ones.
+        verb (str): The HTTP method.
+        params (Sequence[Param]): Arguments of the generated method, in order.
+        media (str): `image`, `images` or `audio` when the route answers with files.
+        idempotent (bool): Whether calls are safe to send twice, `GET` only by default.
+        timeout (Timeout): Timeouts of an attempt, the client default when None.
+        ttl (float): Seconds responses may be cached, 0 for never.
+        random (bool): Whether every call answers differently, so it is never cached or shared.
+        rate_class (str): Name of the rate limiter bucket shared with similar routes.
+    """
+
+    __slots__ = ("route", "name", "verb", "params", "media", "idempotent", "timeout", "ttl", "random", "rate_class", "key", "_path")
+
+    def __init__(
+        self,
+        route: str,
+        name: str = None,
+        verb: str = "GET",
+        params: Sequence[Param] = (),
+        media: str = None,
+        idempotent: bool = None,
+        timeout: Timeout = None,
+        ttl: float = 0,
+        random: bool = False,
+        rate_class: str = None,
+    ):
+        self.route = route
+        self.name = name
+        self.verb = verb
+        self.params = tuple(params)
+        self.media = media
+        self.idempotent = verb == "GET" if idempotent is None else idempotent
+        self.timeout = timeout
+        self.ttl = ttl
+        self.random = random
+        self.rate_class = rate_class
+        self.key = route.split("{", 1)[0].rstrip("/")
+        self._path = tuple(field for _, field, _, _ in string.Formatter().parse(route) if field)
+
+    def __repr__(self):
+        return f"<Endpoint {self.verb} {self.route}>"
+
+    def prepare(self, arguments: Dict[str, Any]) -> Tuple[str, Dict[str, Any]]:
+        """
+        Returns the route and the fields to send for the bound arguments of a call.
+        """
+        fields = {}
+        for param in self.params:
+            value = arguments[param.name]
+            fields[param.name] = param.normalize(value) if param.normalize else value
+        if not self._path:
+            return self.route, fields
+        route = self.route.format(**fields)
+        for name in self._path:
+            del fields[name]
+        return route, fields
+
+    def docstring(self) -> str:
+        lines = ["Returns An Object.", "", "        Parameters:"]
+        for param in self.params + (DEADLINE,):
+            optional = "" if param.default is REQUIRED else " [OPTIONAL]"
+            lines.append(f"                {param.name} ({param.type_name}): {param.doc}{optional}")
+        lines.append("        Returns:")
+        lines.append(f"                {_RETURNS[self.media]}")
+        return "\n".join(lines) + "\n"
+
+
+def _method(endpoint: Endpoint) -> Callable:
+    signature = inspect.Signature(
+        [inspect.Parameter("self", inspect.Parameter.POSITIONAL_OR_KEYWORD)]
+        + [param.parameter() for param in endpoint.params]
+        + [DEADLINE.parameter().replace(kind=inspect.Parameter.KEYWORD_ONLY)]
+    )
+    body = "params" if endpoint.verb == "GET" else "json"
+
+    async def method(self, *args, **kwargs):
+        arguments = signature.bind(self, *args, **kwargs)
+        arguments.apply_defaults()
+        seconds = arguments.arguments.pop("deadline")
+        route, fields = endpoint.prepare(arguments.arguments)
+        if seconds is None:
+            return await self._request(endpoint.verb, route, **{body: fields})
+        with deadline(seconds):
+            return await self._request(endpoint.verb, route, **{body: fields})
+
+    method.__name__ = endpoint.name
+    method.__signature__ = signature
+    method.__doc__ = endpoint.docstring()
+    return method
+
+
+def with_deadline(func: Callable) -> Callable:
+    """
+    Adds the keyword-only `deadline` argument of generated methods to a
+    hand-written one, limiting that call to `deadline` seconds.
+    """
+    signature = inspect.signature(func)
+    parameters = list(signature.parameters.values())
+    at = len(parameters) - (parameters[-1].kind == inspect.Parameter.VAR_KEYWORD)
+    parameters.insert(at, DEADLINE.parameter().replace(kind=inspect.Parameter.KEYWORD_ONLY))
+
+    @functools.wraps(func)
+    async def method(*args, **kwargs):
+        seconds = kwargs.pop("deadline", None)
+        if seconds is None:
+            return await func(*args, **kwargs)
+        with deadline(seconds):
+            return await func(*args, **kwargs)
+
+    method.__signature__ = signature.replace(parameters=parameters)
+    return method
+
+
+def generate_endpoints(cls: type) -> type:
+    """
+    Adds a method to `cls` for every named endpoint it does not define itself.
+    """
+    for endpoint in ENDPOINTS:
+        if endpoint.name and endpoint.name not in cls.__dict__:
+            method = _method(endpoint)
+            method.__qualname__ = f"{cls.__name__}.{endpoint.name}"
+            method.__module__ = cls.__module__
+            setattr(cls, endpoint.name, method)
+    return cls
+
+
+ENDPOINTS: Tuple[Endpoint, ...] = (
+    Endpoint("advice", "advice", random=True),
+    Endpoint("astronomy", "astronomy"),
+    Endpoint("bully", "bully", random=True),
+    Endpoint("fact", "fact", random=True, timeout=SHORT),
+    Endpoint("joke", "joke", random=True),
+    Endpoint("meme", "meme", media="image", random=True),
+    Endpoint("excuse", "excuse", random=True),
+    Endpoint("riddle", "riddle", random=True),
+    Endpoint("motivate", "motivate", random=True),
+    Endpoint("asq", "asq", params=(
+        Param("query", str, "Query to ask"),
+    )),
+    Endpoint("insult", "insult", random=True, params=(
+        Param("name", str, "Name to insult", ""),
+    )),
+    Endpoint("quote", "quote", random=True, params=(
+        Param("type", str, "Type of result (text/image)", ""),
+    )),
+    Endpoint("truth", "truth", random=True, params=(
+        Param("language", str, "Language of question", "en"),
+    )),
+    Endpoint("dare", "dare", random=True, params=(
+        Param("language", str, "Language of task", "en"),
+    )),
+    Endpoint("apps", "apps", params=(
+        Param("query", str, "Query to search"),
+        Param("limit", int, "Limit the results", 10),
+    )),
+    Endpoint("anime/search", "anime", params=(
+        Param("query", str, "Query to search"),
+    )),
+    Endpoint("anime/manga", "manga", params=(
+        Param("query", str, "Query to search"),
+    )),
+    Endpoint("anime/character", "character", params=(
+        Param("query", str, "Query to search"),
+    )),
+    Endpoint("anime/news", "anime_news", params=(
+        Param("limit", int, "Limit the results", 10),
+    )),
+    Endpoint("xda", "xda", params=(
+        Param("query", str, "Query to search"),
+        Param("limit", int, "Limit the results", 10),
+    )),
+    Endpoint("npm", "npm", ttl=HOUR, params=(
+        Param("query", str, "Query to search"),
+        Param("limit", int, "Limit the results", 10),
+    )),
+    Endpoint("morse/{type}", "morse", timeout=SHORT, params=(
+        Param("text", str, "Text to convert"),
+        Param("type", str, "Type of conversion (encode/decode)"),
+    )),
+    Endpoint("udemy/{type}", "udemy", params=(
+        Param("type", str, "Type of course"),
+        Param("page", int, "Page no to parse", 1),
+        Param("limit", int, "Limit the results", 10),
+    )),
+    Endpoint("ubuntu", "ubuntu", params=(
+        Param("query", str, "Query to search"),
+        Param("limit", int, "Limit the results", 10),
+    )),
+    Endpoint("google", "google", params=(
+        Param("query", str, "Query to search"),
+        Param("limit", int, "Limit the results", 10),
+    )),
+    Endpoint("github", "github", params=(
+        Param("query", str, "Query to search"),
+        Param("limit", int, "Limit the results", 10),
+    )),
+    Endpoint("youtube", "youtube", params=(
+        Param("query", str, "Query to search"),
+        Param("limit", int, "Limit the results", 10),
+    )),
+    Endpoint("playlist", "playlist", params=(
+        Param("query", str, "Query to search"),
+        Param("limit", int, "Limit the results", 10),
+    )),
+    Endpoint("wall", "wall", params=(
+        Param("query", str, "Query to search"),
+        Param("limit", int, "Limit the results", 10),
+    )),
+    Endpoint("news", "news", params=(
+        Param("category", str, "News category", ""),
+        Param("limit", int, "Limit the results", 10),
+    )),
+    Endpoint("urban", "urban", params=(
+        Param("query", str, "Query to search"),
+        Param("limit", int, "Limit the results", 10),
+    )),
+    Endpoint("unsplash", "unsplash", params=(
+        Param("query", str, "Query to search"),
+        Param("limit", int, "Limit the results", 10),
+    )),
+    Endpoint("weather", "weather", params=(
+        Param("city", str, "Name of the city"),
+        Param("type", str, "Type of result (text/image)", "text"),
+    )),
+    Endpoint("dictionary", "dictionary", ttl=DAY, params=(
+        Param("query", str, "Query to search"),
+        Param("limit", int, "Limit the results", 10),
+    )),
+    Endpoint("reddit", "reddit", params=(
+        Param("query", str, "Query to search"),
+        Param("limit", int, "Limit the results", 10),
+        Param("subreddit", list, "Subreddits to include", [], normalize=join_list),
+        Param("nsfw", bool, "Whether include adult content", False, normalize=lower_bool),
+    )),
+    Endpoint("chatbot", "chatbot", random=True, rate_class="ai", params=(
+        Param("query", str, "Query to compute"),
+        Param("user_id", int, "Unique user_id", 0),
+        Param("bot_name", str, "Your bot_name", ""),
+        Param("bot_master", str, "Developer name", ""),
+    )),
+    Endpoint("lyrics", "lyrics", params=(
+        Param("title", str, "Title of the song"),
+        Param("artist", str, "Artist of the song", ""),
+    )),
+    Endpoint("wiki", "wiki", ttl=HOUR, params=(
+        Param("query", str, "Query to search"),
+        Param("limit", int, "Limit the results", 10),
+    )),
+    Endpoint("ipinfo", "ipinfo", ttl=DAY, params=(
+        Param("ip", str, "IP to search"),
+    )),
+    Endpoint("bininfo", "bininfo", ttl=DAY, params=(
+        Param("bin", int, "Bin to search"),
+    )),
+    Endpoint("covidinfo", "covidinfo", params=(
+        Param("country", str, "Country name"),
+    )),
+    Endpoint("countryinfo", "countryinfo", ttl=DAY, params=(
+        Param("country", str, "Country name"),
+    )),
+    Endpoint("fakeinfo", "fakeinfo", random=True, params=(
+        Param("country", str, "Country code or iso", ""),
+    )),
+    Endpoint("acronym", "acronym", ttl=DAY, params=(
+        Param("word", str, "Word to search"),
+    )),
+    Endpoint("recognize", "recognize", params=(
+        Param("image", str, "Image url"),
+    )),
+    Endpoint("currency", "currency", params=(
+        Param("origin", str, "Origin of currency"),
+        Param("target", str, "Targeted currency to convert"),
+        Param("amount", int, "Amount of currency to convert"),
+    )),
+    Endpoint("tradingview", "tradingview", params=(
+        Param("symbol", str, "Crypto symbol to search"),
+        Param("interval", str, "Interval of trading", "1h"),
+    )),
+    Endpoint("proxy/{type}", "proxy", params=(
+        Param("type", str, "Type of proxy"),
+        Param("country", str, "Country code", "all"),
+        Param("limit", int, "Limit the results", 10),
+    )),
+    Endpoint("figlet", "figlet", params=(
+        Param("text", str, "Some text"),
+        Param("font", str, "Font name", ""),
+    )),
+    Endpoint("pypi", "pypi", ttl=HOUR, params=(
+        Param("query", str, "Exact package name"),
+    )),
+    Endpoint("image", "image", params=(
+        Param("query", str, "Query to search"),
+        Param("limit", int, "Limit the results", 10),
+    )),
+    Endpoint("qrcode", "qrcode", media="image", rate_class="render", params=(
+        Param("text", str, "Some text"),
+    )),
+    Endpoint("shortlink", "shortlink", params=(
+        Param("url", str, "Long url"),
+        Param("domain", str, "Domain", ""),
+    )),
+    Endpoint("bypasslink", "bypasslink", params=(
+        Param("url", str, "Short url"),
+        Param("domain", str, "Domain", ""),
+    )),
+    Endpoint("ccgen", "ccgen", random=True, params=(
+        Param("bins", List[Union[str, int]], "List of bins", normalize=join_list),
+        Param("limit", int, "Limit the number of cards", 10),
+    )),
+    Endpoint("subtitle", "subtitle", params=(
+        Param("query", str, "Query to search"),
+        Param("limit", int, "Limit the results", 10),
+        Param("language", str, "Language of subtitle", "all"),
+    )),
+    Endpoint("skcheck", "skcheck", params=(
+        Param("key", str, "Stripe key"),
+    )),
+    Endpoint("spellcheck", "spellcheck", params=(
+        Param("text", str, "Some text"),
+    )),
+    Endpoint("paraphrase", "paraphrase", verb="POST", idempotent=True, rate_class="ai", params=(
+        Param("text", str, "Some text"),
+        Param("creativity", int, "Creativity level (1-3)", 2),
+    )),
+    Endpoint("grammarly", "grammarly", verb="POST", idempotent=True, rate_class="ai", params=(
+        Param("text", str, "Some text"),
+    )),
+    Endpoint("tgsticker", "tgsticker", params=(
+        Param("query", str, "Query to search"),
+        Param("limit", int, "Limit the results", 10),
+    )),
+    Endpoint("torrent", "torrent", params=(
+        Param("query", str, "Query to search"),
+        Param("limit", int, "Limit the results", 10),
+    )),
+    Endpoint("stackoverflow", "stackoverflow", params=(
+        Param("query", str, "Query to search"),
+        Param("limit", int, "Limit the results", 10),
+    )),
+    Endpoint("spotify", "spotify", params=(
+        Param("query", str, "Query to search"),
+        Param("limit", int, "Limit the results", 10),
+    )),
+    Endpoint("translate", "translate", verb="POST", idempotent=True, params=(
+        Param("text", str, "Text to translate"),
+        Param("source", str, "Language code of source language", "auto"),
+        Param("target", str, "Language code of target language", "en"),
+    )),
+    Endpoint("paste", "paste", verb="POST", params=(
+        Param("content", str, "Text content to paste"),
+        Param("title", str, "Title of the page", None),
+        Param("language", str, "Language for highlight", None),
+        Param("ephemeral", bool, "Whether one-time view", False),
+    )),
+    Endpoint("write", "write", verb="POST", media="images", idempotent=True, rate_class="render", params=(
+        Param("text", str, "Text to write"),
+        Param("page", str, "Page name", None),
+        Param("font", str, "Font name", None),
+        Param("color", str, "Color of text", "black"),
+    )),
+    Endpoint("logo", "logo", media="image", rate_class="render", params=(
+        Param("text", str, "Text to make logo"),
+        Param("color", str, "Logo text color", ""),
+        Param("keyword", str, "Logo keywords", ""),
+        Param("limit", int, "Limit the results", 10),
+        Param("version", int, "Version of logo", 1),
+    )),
+    Endpoint("webshot", "webshot", verb="POST", media="image", idempotent=True, timeout=LONG, rate_class="render", params=(
+        Param("url", str, "The website url with http", normalize=http_url),
+        Param("width", int, "Width of webshot", 1920),
+        Param("height", int, "Height of webshot", 1080),
+        Param("delay", float, "Delay in seconds", 0.1),
+        Param("full", bool, "Whether capture full page", False),
+    )),
+    # Routes served by hand-written methods of SafoneAPI.
+    Endpoint("anime/nsfw/{type}", media="image", random=True),
+    Endpoint("anime/sfw/{type}", media="image", random=True),
+    Endpoint("carbon", verb="POST", media="image", idempotent=True, rate_class="render"),
+    Endpoint("rayso", verb="POST", media="image", idempotent=True, rate_class="render"),
+    Endpoint("quotly", verb="POST", media="image", idempotent=True, rate_class="render"),
+    Endpoint("speech", verb="POST", media="audio", idempotent=True, rate_class="render"),
+    Endpoint("speech/characters", ttl=HOUR),
+    Endpoint("spam", verb="POST", idempotent=True),
+    Endpoint("imdb"),
+    Endpoint("tmdb"),
+    Endpoint("shazam", verb="POST", rate_class="upload"),
+    Endpoint("nsfw", rate_class="upload"),
+    Endpoint("ocr", rate_class="upload"),
+    Endpoint("removebg", media="image", rate_class="upload"),
+    Endpoint("telegraph/text", verb="POST"),
+    Endpoint("telegraph/media", verb="POST", rate_class="upload"),
+    Endpoint("execute", verb="POST", timeout=LONG),
+    Endpoint("execute/languages", ttl=HOUR),
+    Endpoint("gemini", verb="POST", rate_class="ai"),
+    Endpoint("llama", verb="POST", rate_class="ai"),
+    Endpoint("chatgpt", verb="POST", rate_class="ai"),
+    Endpoint("imagine", media="images", timeout=LONG, random=True, rate_class="ai"),
+)
+
+# Per-route policy, keyed by route prefix and looked up with match_route.
+ROUTES: Dict[str, Endpoint] = {endpoint.key: endpoint for endpoint in ENDPOINTS}
+RANDOM_ROUTES = frozenset(key for key, endpoint in ROUTES.items() if endpoint.random)
+DEFAULT_TTLS = {key: endpoint.ttl for key, endpoint in ROUTES.items() if endpoint.ttl}
+DEFAULT_TIMEOUTS = {key: endpoint.timeout for key, endpoint in ROUTES.items() if endpoint.timeout}
+RATE_CLASSES = {key: endpoint.rate_class for key, endpoint in ROUTES.items() if endpoint.rate_class}
+
+
+def route_key(route: str) -> str:
+    """
+    Returns the registry key of a route, like `udemy` for `udemy/free`, so
+    per-route state does not grow with every user-supplied path value.
+    Routes missing from the registry are returned as they are.
+    """
+    endpoint = match_route(ROUTES, route)
+    return endpoint.key if endpoint else route
@@ -29,12 +29,14 @@ class BaseError(Exception):
         message (str): The error message.
         error_message (str): The error message.
         success (bool): The success status of the request.
+        response (Response): The response which caused the error, if any.
     """
     message = "An error occurred!"
 
-    def __init__(self, error=None):
+    def __init__(self, error=None, response=None):
         self.success = False
         self.error_message = error or self.message
+        self.response = response
 
     def __str__(self):
         return self.error_message
@@ -83,3 +85,17 @@ class ConnectionError(BaseError):
     Raised when a connection error occurs.
     """
     message = "Failed to communicate server, Please report this: https://api.safone.co/report"
+
+
+class CircuitOpen(BaseError):
+    """
+    Raised without calling the server while the route is failing.
+    """
+    message = "Service Unavailable, The route is failing, Please try again later"
+
+
+class DeadlineExceeded(TimeoutError):
+    """
+    Raised when the deadline of a call passed, across all its attempts.
+    """
+    message = "Deadline Exceeded, The call ran out of time"
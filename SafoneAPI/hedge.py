@@ -0,0 +1,157 @@
+"""
+SafoneAPI v1.0
+Copyright (c) 2025 AsmSafone
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import time
+import asyncio
+from collections import deque
+from typing import Dict, Iterable, Mapping, Optional, Union
+
+from .endpoints import route_key
+from .middleware import Handler, Middleware, Request, Response, match_route
+from .retry import RetryBudget
+
+# Interactive routes whose calls are safe to send twice.
+DEFAULT_HEDGE_ROUTES = ("chatbot", "spellcheck", "translate", "weather")
+
+_UNLISTED = object()
+
+
+class _Latency:
+    __slots__ = ("samples", "quantile", "stale")
+
+    def __init__(self, window: int):
+        self.samples = deque(maxlen=window)
+        self.quantile = None
+        self.stale = 0
+
+
+class Hedger(Middleware):
+    """
+    Sends a second copy of a slow call and keeps whichever answers first.
+
+    When a call to one of `routes` has not completed after its hedge
+    delay, a duplicate is sent and the first successful response wins
+    while the other one is cancelled. The delay is the fixed one given
+    for the route, otherwise the observed `quantile` of its latency once
+    `min_samples` calls were measured, and `initial_delay` before that.
+    Uploads and calls which are not idempotent are never hedged, even
+    when their route is listed. Hedges are capped by a budget like the
+    one of RetryPolicy, so they can never exceed `max_ratio` of the calls.
+
+    Args:
+        routes (Union[Iterable[str], Mapping[str, float]]): Routes to hedge, optionally mapped to a fixed delay in seconds.
+        initial_delay (float): Delay used until enough latencies were measured.
+        min_delay (float): Lower bound of the observed delay in seconds.
+        quantile (float): Latency quantile after which a call is hedged.
+        window (int): Number of latencies kept per route.
+        min_samples (int): Latencies needed before the quantile is used.
+        max_ratio (float): Allowed hedges per hedgeable call.
+        reserve (float): Hedges available before any traffic was seen.
+
+    Attributes:
+        hedged (int): Number of duplicate calls sent.
+        wins (int): Number of calls answered by the duplicate.
+    """
+
+    def __init__(
+        self,
+        routes: Union[Iterable[str], Mapping[str, float]] = DEFAULT_HEDGE_ROUTES,
+        initial_delay: float = 1.0,
+        min_delay: float = 0.05,
+        quantile: float = 0.95,
+        window: int = 200,
+        min_samples: int = 20,
+        max_ratio: float = 0.1,
+        reserve: float = 5,
+    ):
+        if isinstance(routes, Mapping):
+            self.routes = dict(routes)
+        else:
+            self.routes = dict.fromkeys(routes)
+        self.initial_delay = initial_delay
+        self.min_delay = min_delay
+        self.quantile = quantile
+        self.window = window
+        self.min_samples = min_samples
+        self.budget = RetryBudget(max_ratio, reserve)
+        self.latencies: Dict[str, _Latency] = {}
+        self.hedged = 0
+        self.wins = 0
+
+    def delay_for(self, route: str) -> Optional[float]:
+        """
+        Returns the hedge delay of the route, or None if it is not hedged.
+        """
+        fixed = match_route(self.routes, route, _UNLISTED)
+        if fixed is _UNLISTED:
+            return None
+        if fixed is not None:
+            return fixed
+        latency = self.latencies.get(route_key(route))
+        if latency is None or len(latency.samples) < self.min_samples:
+            return self.initial_delay
+        if latency.quantile is None or latency.stale >= 10:
+            ordered = sorted(latency.samples)
+            latency.quantile = ordered[min(len(ordered) - 1, int(len(ordered) * self.quantile))]
+            latency.stale = 0
+        return max(self.min_delay, latency.quantile)
+
+    def observe(self, route: str, seconds: float):
+        route = route_key(route)
+        latency = self.latencies.get(route)
+        if latency is None:
+            latency = self.latencies[route] = _Latency(self.window)
+        latency.samples.append(seconds)
+        latency.stale += 1
+
+    async def __call__(self, request: Request, handler: Handler) -> Response:
+        if request.data is not None or not request.idempotent:
+            return await handler(request)
+        delay = self.delay_for(request.route)
+        if delay is None:
+            return await handler(request)
+        self.budget.deposit()
+        started = time.monotonic()
+        tasks = [asyncio.ensure_future(handler(request))]
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if not done and self.budget.withdraw():
+                self.hedged += 1
+                tasks.append(asyncio.ensure_future(handler(request)))
+            pending, error = set(tasks), None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is not tasks[0]:
+                            self.wins += 1
+                        self.observe(request.route, time.monotonic() - started)
+                        return task.result()
+                    error = error or task.exception()
+            raise error
+        finally:
+            losers = [task for task in tasks if not task.done()]
+            for task in losers:
+                task.cancel()
+            if losers:
+                await asyncio.gather(*losers, return_exceptions=True)
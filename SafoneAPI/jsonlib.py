@@ -0,0 +1,73 @@
+"""
+SafoneAPI v1.0
+Copyright (c) 2025 AsmSafone
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import json
+from typing import Any, Callable, Union
+
+
+class JSONCodec:
+    """
+    A pair of functions used to encode request bodies and decode responses.
+
+    Args:
+        loads (Callable): Decodes `bytes` or `str` to python objects.
+        dumps (Callable): Encodes python objects to `bytes` or `str`.
+        name (str): Name of the codec, for display only.
+    """
+
+    def __init__(
+        self,
+        loads: Callable[[Union[bytes, str]], Any],
+        dumps: Callable[[Any], Union[bytes, str]],
+        name: str = "custom",
+    ):
+        self.loads = loads
+        self.dumps = dumps
+        self.name = name
+
+    def __repr__(self):
+        return f"<JSONCodec {self.name}>"
+
+    @classmethod
+    def stdlib(cls) -> "JSONCodec":
+        """
+        The codec of the standard `json` module.
+        """
+        return cls(json.loads, lambda obj: json.dumps(obj, separators=(",", ":")), "json")
+
+    @classmethod
+    def auto(cls) -> "JSONCodec":
+        """
+        The fastest installed codec, `orjson`, then `ujson`, then the standard `json` module.
+        """
+        try:
+            import orjson
+            return cls(orjson.loads, orjson.dumps, "orjson")
+        except ImportError:
+            pass
+        try:
+            import ujson
+            return cls(ujson.loads, lambda obj: ujson.dumps(obj, ensure_ascii=False), "ujson")
+        except ImportError:
+            pass
+        return cls.stdlib()
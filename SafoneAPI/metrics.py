@@ -0,0 +1,215 @@
+"""
+SafoneAPI v1.0
+Copyright (c) 2025 AsmSafone
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import time
+from bisect import bisect_left
+from typing import Dict, Sequence
+
+from .errors import BaseError
+from .endpoints import route_key
+from .middleware import Handler, Middleware, Request, Response
+
+# Upper bounds in seconds, from a cached answer to a rendered image.
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+
+class RouteStats:
+    """
+    Counters of a single route.
+
+    Attributes:
+        calls (int): Number of finished calls.
+        in_flight (int): Number of calls currently running.
+        buckets (List[int]): Calls per latency bucket, not cumulative, the last one above every bound.
+        latency_sum (float): Sum of all latencies in seconds.
+        statuses (Dict[int, int]): Calls per HTTP status code.
+        errors (Dict[str, int]): Failed calls per error class name.
+        bytes_sent (int): Request body bytes, when known before sending.
+        bytes_received (int): Response body bytes, cache hits excluded.
+        cache_hits (int): Calls answered from the response cache.
+        cache_misses (int): Cacheable calls which went to the network.
+    """
+
+    __slots__ = (
+        "calls",
+        "in_flight",
+        "buckets",
+        "latency_sum",
+        "statuses",
+        "errors",
+        "bytes_sent",
+        "bytes_received",
+        "cache_hits",
+        "cache_misses",
+    )
+
+    def __init__(self, size: int):
+        self.calls = 0
+        self.in_flight = 0
+        self.buckets = [0] * size
+        self.latency_sum = 0.0
+        self.statuses = {}
+        self.errors = {}
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+
+def _label(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+def _number(value) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Metrics(Middleware):
+    """
+    Records per-route latency, status codes, errors, bytes and cache usage.
+
+    Installed as the outermost middleware, so latencies are the ones seen
+    by the caller, retries and queueing included. Read the numbers with
+    `snapshot()` or export them with `prometheus()`.
+
+    Args:
+        buckets (Sequence[float]): Upper bounds of the latency histogram in seconds.
+        namespace (str): Prefix of the exported metric names.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS, namespace: str = "safoneapi"):
+        self.bounds = tuple(sorted(buckets))
+        self.namespace = namespace
+        self.routes: Dict[str, RouteStats] = {}
+
+    def _stats(self, route: str) -> RouteStats:
+        stats = self.routes.get(route)
+        if stats is None:
+            stats = self.routes[route] = RouteStats(len(self.bounds) + 1)
+        return stats
+
+    def reset(self):
+        self.routes.clear()
+
+    async def __call__(self, request: Request, handler: Handler) -> Response:
+        stats = self._stats(route_key(request.route))
+        stats.in_flight += 1
+        started = time.perf_counter()
+        response = None
+        try:
+            response = await handler(request)
+            return response
+        except BaseError as error:
+            name = type(error).__name__
+            stats.errors[name] = stats.errors.get(name, 0) + 1
+            response = error.response
+            raise
+        finally:
+            elapsed = time.perf_counter() - started
+            stats.in_flight -= 1
+            stats.calls += 1
+            stats.latency_sum += elapsed
+            stats.buckets[bisect_left(self.bounds, elapsed)] += 1
+            context = request.context
+            hit = context.get("cache_hit")
+            if hit:
+                stats.cache_hits += 1
+            elif hit is not None:
+                stats.cache_misses += 1
+            if response is not None:
+                stats.statuses[response.status] = stats.statuses.get(response.status, 0) + 1
+                if not hit:
+                    stats.bytes_received += response.size
+            stats.bytes_sent += context.get("bytes_sent", 0)
+
+    def snapshot(self) -> Dict[str, dict]:
+        """
+        Returns the counters of every route as plain dicts, with cumulative histogram buckets.
+        """
+        snapshot = {}
+        for route, stats in list(self.routes.items()):
+            cumulative, buckets = 0, {}
+            for bound, count in zip(self.bounds + (float("inf"),), stats.buckets):
+                cumulative += count
+                buckets[bound] = cumulative
+            lookups = stats.cache_hits + stats.cache_misses
+            snapshot[route] = {
+                "calls": stats.calls,
+                "in_flight": stats.in_flight,
+                "latency": {
+                    "count": stats.calls,
+                    "sum": stats.latency_sum,
+                    "mean": stats.latency_sum / stats.calls if stats.calls else 0.0,
+                    "buckets": buckets,
+                },
+                "statuses": dict(stats.statuses),
+                "errors": dict(stats.errors),
+                "bytes_sent": stats.bytes_sent,
+                "bytes_received": stats.bytes_received,
+                "cache_hits": stats.cache_hits,
+                "cache_misses": stats.cache_misses,
+                "cache_hit_ratio": stats.cache_hits / lookups if lookups else 0.0,
+            }
+        return snapshot
+
+    def prometheus(self) -> str:
+        """
+        Returns the counters in the Prometheus text exposition format.
+        """
+        ns = self.namespace
+        snapshot = self.snapshot()
+        lines = []
+
+        def family(name, kind, help, samples):
+            lines.append(f"# HELP {ns}_{name} {help}")
+            lines.append(f"# TYPE {ns}_{name} {kind}")
+            for suffix, labels, value in samples:
+                rendered = ",".join(f'{key}="{_label(val)}"' for key, val in labels)
+                lines.append(f"{ns}_{name}{suffix}{{{rendered}}} {_number(value)}")
+
+        histogram = []
+        for route, stats in snapshot.items():
+            latency = stats["latency"]
+            for bound, count in latency["buckets"].items():
+                le = "+Inf" if bound == float("inf") else _number(float(bound))
+                histogram.append(("_bucket", (("route", route), ("le", le)), count))
+            histogram.append(("_sum", (("route", route),), latency["sum"]))
+            histogram.append(("_count", (("route", route),), latency["count"]))
+        family("request_duration_seconds", "histogram", "Latency of calls as seen by the caller.", histogram)
+        family("responses_total", "counter", "Responses per HTTP status code.", [
+            ("", (("route", route), ("status", status)), count)
+            for route, stats in snapshot.items() for status, count in sorted(stats["statuses"].items())
+        ])
+        family("errors_total", "counter", "Failed calls per error class.", [
+            ("", (("route", route), ("error", error)), count)
+            for route, stats in snapshot.items() for error, count in sorted(stats["errors"].items())
+        ])
+        for name, kind, help, key in (
+            ("in_flight", "gauge", "Calls currently running.", "in_flight"),
+            ("request_bytes_total", "counter", "Request body bytes sent.", "bytes_sent"),
+            ("response_bytes_total", "counter", "Response body bytes received.", "bytes_received"),
+            ("cache_hits_total", "counter", "Calls answered from the response cache.", "cache_hits"),
+            ("cache_misses_total", "counter", "Cacheable calls which went to the network.", "cache_misses"),
+        ):
+            family(name, kind, help, [("", (("route", route),), stats[key]) for route, stats in snapshot.items()])
+        return "\n".join(lines) + "\n"
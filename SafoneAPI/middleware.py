@@ -0,0 +1,178 @@
+"""
+SafoneAPI v1.0
+Copyright (c) 2025 AsmSafone
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from typing import Any, Awaitable, Callable, Mapping, Optional, Sequence, Union
+
+from .errors import BaseError
+from .timeouts import Timeout
+
+
+class Request:
+    """
+    A single call going through the request engine.
+
+    Attributes:
+        method (str): The HTTP method, `GET` or `POST`.
+        route (str): The api route, relative to the base url.
+        params (dict): Query parameters of a `GET` request.
+        data (dict): Form data of a multipart `POST` request.
+        json (dict): Body of a json `POST` request.
+        timeout (Timeout): Timeouts of a single attempt.
+        deadline (float): Monotonic time the whole call must finish by, across retries and queueing.
+        idempotent (bool): Whether the call is safe to send more than once.
+        context (dict): Free-form storage shared by the middlewares of this call.
+    """
+
+    __slots__ = ("method", "route", "params", "data", "json", "timeout", "deadline", "idempotent", "context")
+
+    def __init__(
+        self,
+        method: str,
+        route: str,
+        params: dict = None,
+        data: dict = None,
+        json: dict = None,
+        timeout: Union[Timeout, float] = 60,
+        idempotent: bool = None,
+        deadline: float = None,
+    ):
+        self.method = method
+        self.route = route
+        self.params = params
+        self.data = data
+        self.json = json
+        self.timeout = Timeout.of(timeout)
+        self.deadline = deadline
+        self.idempotent = method == "GET" if idempotent is None else idempotent
+        self.context = {}
+
+    @property
+    def key(self) -> tuple:
+        """
+        A hashable identity of the call, equal for calls with the same route and params.
+        """
+        params = self.params or {}
+        return (
+            self.method,
+            self.route,
+            tuple(sorted((str(k), str(v)) for k, v in params.items() if v is not None)),
+        )
+
+    def __repr__(self):
+        return f"<Request {self.method} {self.route}>"
+
+
+class Response:
+    """
+    The decoded response of a call, before it is turned into a Result.
+
+    Attributes:
+        status (int): The HTTP status code.
+        headers (Mapping): The response headers.
+        data (dict): The decoded json body.
+        size (int): The size of the response body in bytes.
+    """
+
+    __slots__ = ("status", "headers", "data", "size")
+
+    def __init__(self, status: int, headers=None, data: dict = None, size: int = 0):
+        self.status = status
+        self.headers = headers or {}
+        self.data = data
+        self.size = size
+
+    def __repr__(self):
+        return f"<Response status={self.status} size={self.size}>"
+
+
+Handler = Callable[[Request], Awaitable[Response]]
+
+
+class Middleware:
+    """
+    Base class for request interceptors.
+
+    Override any of the hooks to observe or change a call. Middlewares
+    which need to wrap the whole call (retries, caching, coalescing)
+    override `__call__` instead and decide themselves when to call `handler`.
+    """
+
+    async def before_send(self, request: Request) -> Optional[Response]:
+        """
+        Called before the request is sent. Returning a Response skips the rest of the chain.
+        """
+        return None
+
+    async def after_receive(self, request: Request, response: Response) -> Response:
+        """
+        Called with every successful response, may return a replacement.
+        """
+        return response
+
+    async def on_error(self, request: Request, error: BaseError) -> Optional[Response]:
+        """
+        Called when the call failed. Returning a Response recovers from the error.
+        """
+        return None
+
+    async def __call__(self, request: Request, handler: Handler) -> Response:
+        response = await self.before_send(request)
+        if response is not None:
+            return response
+        try:
+            response = await handler(request)
+        except BaseError as error:
+            response = await self.on_error(request, error)
+            if response is None:
+                raise
+            return response
+        return await self.after_receive(request, response)
+
+
+def match_route(mapping: Mapping[str, Any], route: str, default: Any = None) -> Any:
+    """
+    Looks up a per-route setting, falling back to parent routes,
+    so an entry for `imagine` also applies to `imagine/nsfw`.
+    """
+    while True:
+        if route in mapping:
+            return mapping[route]
+        if "/" not in route:
+            return default
+        route = route.rsplit("/", 1)[0]
+
+
+def _bind(middleware: Middleware, handler: Handler) -> Handler:
+    async def call(request: Request) -> Response:
+        return await middleware(request, handler)
+    return call
+
+
+def build_chain(middlewares: Sequence[Middleware], handler: Handler) -> Handler:
+    """
+    Composes the middlewares around the handler, the first one being the outermost.
+    Without any middleware the handler itself is returned, so it costs nothing.
+    """
+    for middleware in reversed(middlewares):
+        handler = _bind(middleware, handler)
+    return handler
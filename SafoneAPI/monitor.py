@@ -0,0 +1,89 @@
+"""
+SafoneAPI v1.0
+Copyright (c) 2025 AsmSafone
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import time
+import asyncio
+from typing import Callable, Optional
+
+
+class LoopLagMonitor:
+    """
+    Measures how late the event loop wakes up a sleeping task.
+
+    A ticker sleeps for `interval` seconds in a loop and records by how
+    much each wake-up overshot it, which is the time the loop spent
+    blocked by other work. Use it as an async context manager, or call
+    `start()` and `stop()` yourself.
+
+    Args:
+        interval (float): Seconds between two measurements.
+        callback (Callable[[float], None]): Called with every measured lag in seconds.
+
+    Attributes:
+        samples (int): Number of measurements taken.
+        max_lag (float): Highest lag seen in seconds.
+        total_lag (float): Sum of all lags in seconds.
+    """
+
+    def __init__(self, interval: float = 0.01, callback: Optional[Callable[[float], None]] = None):
+        self.interval = interval
+        self.callback = callback
+        self.samples = 0
+        self.max_lag = 0.0
+        self.total_lag = 0.0
+        self._task = None
+
+    @property
+    def mean_lag(self) -> float:
+        return self.total_lag / self.samples if self.samples else 0.0
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.ensure_future(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def __aenter__(self):
+        self.start()
+        return self
+
+    async def __aexit__(self, *args):
+        await self.stop()
+
+    async def _run(self):
+        while True:
+            started = time.perf_counter()
+            await asyncio.sleep(self.interval)
+            lag = max(0.0, time.perf_counter() - started - self.interval)
+            self.samples += 1
+            self.total_lag += lag
+            self.max_lag = max(self.max_lag, lag)
+            if self.callback:
+                self.callback(lag)
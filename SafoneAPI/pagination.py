@@ -0,0 +1,89 @@
+"""
+SafoneAPI v1.0
+Copyright (c) 2025 AsmSafone
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import asyncio
+from collections import deque
+from typing import Any, AsyncIterator, Awaitable, Callable, List
+
+from .results import Result
+
+
+def page_items(result: Any, key: str = "results") -> List[Any]:
+    """
+    Returns the list of items held by a paged or search response.
+    """
+    if isinstance(result, list):
+        return result
+    if isinstance(result, Result):
+        items = result.get(key)
+        if isinstance(items, list):
+            return items
+    return []
+
+
+async def paginate(
+    fetch_page: Callable[[int], Awaitable[List[Any]]],
+    max_items: int = None,
+    page_size: int = None,
+    prefetch: int = 1,
+    start: int = 1,
+) -> AsyncIterator[Any]:
+    """
+    Yields the items of consecutive pages, fetching up to `prefetch` pages
+    ahead while the current one is consumed.
+
+    At most `prefetch + 1` pages are held at once. Iteration stops at the
+    first empty page or once `max_items` items were yielded, and no page
+    beyond that budget is requested when `page_size` is known. Pages still
+    in flight are cancelled when the iterator is closed.
+    """
+    tasks = deque()
+    next_page = start
+    scheduled = 0
+    yielded = 0
+
+    def schedule():
+        nonlocal next_page, scheduled
+        if max_items is not None and page_size and scheduled * page_size >= max_items:
+            return
+        tasks.append(asyncio.ensure_future(fetch_page(next_page)))
+        next_page += 1
+        scheduled += 1
+
+    try:
+        for _ in range(1 + max(0, prefetch)):
+            schedule()
+        while tasks:
+            items = await tasks.popleft()
+            if not items:
+                return
+            schedule()
+            for item in items:
+                if max_items is not None and yielded >= max_items:
+                    return
+                yield item
+                yielded += 1
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
@@ -0,0 +1,340 @@
+"""
+SafoneAPI v1.0
+Copyright (c) 2025 AsmSafone
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import time
+import asyncio
+import logging
+import weakref
+from functools import partial
+from typing import Callable, Dict, Optional, Tuple, Union
+
+from .errors import RateLimitExceeded
+from .endpoints import RATE_CLASSES
+from .middleware import Handler, Middleware, Request, Response, match_route
+from .retry import parse_retry_after
+from .sqlite import SQLiteConnection
+from .timeouts import within
+
+_log = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """
+    An adaptive token bucket which queues callers until a token is available.
+
+    The refill rate is halved whenever the server answers with a 429 and
+    slowly grows back to the configured rate with every successful call.
+    A `Retry-After` sent with the 429 empties the bucket for that long.
+
+    Args:
+        rate (float): Tokens refilled per second.
+        capacity (float): Maximum burst size, defaults to one second worth of tokens.
+        min_rate (float): Lowest rate the bucket adapts down to.
+        decrease (float): Factor the rate is multiplied with on a 429.
+        increase (float): Fraction of the configured rate regained per success.
+
+    Attributes:
+        waiting (int): Number of callers queued for a token.
+    """
+
+    clock: Callable[[], float] = staticmethod(time.monotonic)
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float = None,
+        min_rate: float = None,
+        decrease: float = 0.5,
+        increase: float = 0.05,
+    ):
+        self.max_rate = rate
+        self.rate = rate
+        self.capacity = capacity or max(1.0, rate)
+        self.min_rate = min_rate or rate / 10
+        self.decrease = decrease
+        self.increase = increase
+        self.tokens = self.capacity
+        self.updated = self.clock()
+        self.waiting = 0
+        self._locks = weakref.WeakKeyDictionary()
+
+    def _refill(self):
+        now = self.clock()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self):
+        """
+        Waits until a token is available and takes it, serving callers in arrival order.
+        Each event loop queues its callers on its own lock.
+        """
+        loop = asyncio.get_running_loop()
+        lock = self._locks.get(loop)
+        if lock is None:
+            lock = self._locks[loop] = asyncio.Lock()
+        self.waiting += 1
+        try:
+            async with lock:
+                self._refill()
+                while self.tokens < 1:
+                    await asyncio.sleep((1 - self.tokens) / self.rate)
+                    self._refill()
+                self.tokens -= 1
+        finally:
+            self.waiting -= 1
+
+    def penalize(self, retry_after: float = None):
+        self._refill()
+        self.rate = max(self.min_rate, self.rate * self.decrease)
+        if retry_after:
+            self.tokens = min(self.tokens, 1 - retry_after * self.rate)
+
+    def reward(self):
+        if self.rate < self.max_rate:
+            self._refill()
+            self.rate = min(self.max_rate, self.rate + self.max_rate * self.increase)
+
+
+class SQLiteRateStore:
+    """
+    Token bucket state kept in a SQLite database, shared by every process using the same file.
+
+    Each bucket is one row holding its tokens, last refill time and current
+    rate, read and written in a single immediate transaction so processes
+    never hand out the same token twice. The database runs in WAL mode and
+    queries run in the default executor, like `SQLiteCache`. The connection
+    is reopened after a fork, so a store created before the workers fork
+    can be shared by all of them. Give every application its own file, as
+    all processes using one file share its buckets.
+
+    Args:
+        path (str): Path of the database file.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._db = SQLiteConnection(path, (
+            "CREATE TABLE IF NOT EXISTS buckets (key TEXT PRIMARY KEY, tokens REAL, updated REAL, rate REAL)",
+        ))
+        self._lock = self._db.lock
+
+    def modify(self, key: str, func: Callable[[Optional[Tuple[float, float, float]]], Tuple[tuple, object]]):
+        """
+        Atomically replaces the (tokens, updated, rate) state of a bucket with the one returned by `func`.
+        `func` receives None for a new bucket and returns the new state along with a result to return.
+        """
+        with self._lock:
+            db = self._db.connect()
+            db.execute("BEGIN IMMEDIATE")
+            try:
+                row = db.execute("SELECT tokens, updated, rate FROM buckets WHERE key = ?", (key,)).fetchone()
+                state, result = func(row)
+                db.execute("INSERT OR REPLACE INTO buckets VALUES (?, ?, ?, ?)", (key,) + tuple(state))
+                db.execute("COMMIT")
+            except BaseException:
+                db.execute("ROLLBACK")
+                raise
+        return result
+
+    def clear(self):
+        with self._lock:
+            self._db.connect().execute("DELETE FROM buckets")
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+
+class SharedTokenBucket(TokenBucket):
+    """
+    A token bucket whose tokens and adaptive rate live in a `SQLiteRateStore`.
+
+    Every bucket with the same `key` in the same store, in any process on
+    the host, draws from one pool of tokens, and a 429 seen by one process
+    slows down all of them. Callers reserve their token up front and sleep
+    until it is due, so a call costs one transaction instead of polling.
+    Successful calls raising the rate back are written together, at most
+    once per `reward_interval` seconds. Writes nobody waits for, like
+    these, log their errors instead of raising them.
+
+    Args:
+        store (SQLiteRateStore): Where the bucket state is shared.
+        key (str): Name of the bucket in the store.
+        rate (float): Tokens refilled per second.
+        reward_interval (float): Minimum seconds between two writes of the regained rate.
+        **kwargs: Passed to `TokenBucket`.
+    """
+
+    clock = staticmethod(time.time)
+
+    def __init__(self, store: SQLiteRateStore, key: str, rate: float, reward_interval: float = 1.0, **kwargs):
+        super().__init__(rate, **kwargs)
+        self.store = store
+        self.key = key
+        self.reward_interval = reward_interval
+        self._rewards = 0
+        self._rewarded = 0.0
+
+    def _apply(self, change: Callable[[], object]):
+        def func(state):
+            if state is not None:
+                tokens, self.updated, rate = state
+                self.tokens = min(tokens, self.capacity)
+                self.rate = min(rate, self.max_rate)
+            result = change()
+            return (self.tokens, self.updated, self.rate), result
+
+        return self.store.modify(self.key, func)
+
+    def _reserve(self) -> float:
+        self._refill()
+        self.tokens -= 1
+        return max(0.0, -self.tokens / self.rate)
+
+    def _refund(self):
+        self.tokens += 1
+
+    def _reward(self, count: int):
+        if self.rate < self.max_rate:
+            self._refill()
+            self.rate = min(self.max_rate, self.rate + self.max_rate * self.increase * count)
+
+    def _submit(self, change: Callable[[], object]):
+        return asyncio.get_running_loop().run_in_executor(None, partial(self._apply, change))
+
+    def _post(self, change: Callable[[], object]):
+        self._submit(change).add_done_callback(self._log_failure)
+
+    def _log_failure(self, future: asyncio.Future):
+        if not future.cancelled() and future.exception() is not None:
+            _log.error("updating the shared rate limit bucket %s failed", self.key, exc_info=future.exception())
+
+    async def acquire(self):
+        """
+        Reserves the next shared token and waits until it is due.
+        """
+        self.waiting += 1
+        try:
+            delay = await self._submit(self._reserve)
+            if delay:
+                try:
+                    await asyncio.sleep(delay)
+                except asyncio.CancelledError:
+                    self._post(self._refund)
+                    raise
+        finally:
+            self.waiting -= 1
+
+    def penalize(self, retry_after: float = None):
+        self._rewards = 0
+        self._post(partial(TokenBucket.penalize, self, retry_after))
+
+    def reward(self):
+        if self.rate >= self.max_rate:
+            return
+        self._rewards += 1
+        now = time.monotonic()
+        if now - self._rewarded < self.reward_interval:
+            return
+        self._rewarded = now
+        count, self._rewards = self._rewards, 0
+        self._post(partial(self._reward, count))
+
+
+class RateLimiter(Middleware):
+    """
+    Paces calls client-side so they are queued instead of rejected by the server.
+
+    Every call takes a token from its route bucket, or else from the bucket
+    of its rate class (like `ai` or `render`, see `endpoints.py`), and then
+    from the global bucket. Routes fall back to their parent, so a bucket
+    for `imagine` also paces `imagine/nsfw`. A call whose deadline passes
+    while it is queued leaves the queue with DeadlineExceeded.
+
+    With a `store`, the buckets built from rates are shared with every
+    other process using the same store, so worker processes together stay
+    within the limits and back off together on a 429.
+
+    Args:
+        rate (float): Global requests per second, `None` for no global limit.
+        routes (Dict[str, Union[float, TokenBucket]]): Requests per second or a bucket per route.
+        classes (Dict[str, Union[float, TokenBucket]]): Requests per second or a bucket per rate class.
+        store (SQLiteRateStore): Shares the buckets with the other processes using the same store.
+    """
+
+    def __init__(
+        self,
+        rate: float = None,
+        routes: Dict[str, Union[float, TokenBucket]] = None,
+        classes: Dict[str, Union[float, TokenBucket]] = None,
+        store: SQLiteRateStore = None,
+    ):
+        self.store = store
+        self.bucket = self._bucket("global", rate) if rate else None
+        self.routes = {route: self._bucket(f"route:{route}", bucket) for route, bucket in (routes or {}).items()}
+        self.classes = {name: self._bucket(f"class:{name}", bucket) for name, bucket in (classes or {}).items()}
+
+    def _bucket(self, key: str, bucket: Union[float, TokenBucket]) -> TokenBucket:
+        if isinstance(bucket, TokenBucket):
+            return bucket
+        if self.store is not None:
+            return SharedTokenBucket(self.store, key, bucket)
+        return TokenBucket(bucket)
+
+    def bucket_for(self, route: str) -> Optional[TokenBucket]:
+        """
+        Returns the bucket pacing a route besides the global one, if any.
+        """
+        bucket = match_route(self.routes, route)
+        if bucket is None and self.classes:
+            bucket = self.classes.get(match_route(RATE_CLASSES, route))
+        return bucket
+
+    def queue_length(self, route: str = None) -> int:
+        """
+        Returns the number of queued callers for a route, or for all buckets.
+        """
+        if route is not None:
+            bucket = self.bucket_for(route) or self.bucket
+            return bucket.waiting if bucket else 0
+        buckets = list(self.routes.values()) + list(self.classes.values()) + [self.bucket]
+        return sum(bucket.waiting for bucket in buckets if bucket)
+
+    async def __call__(self, request: Request, handler: Handler) -> Response:
+        bucket = self.bucket_for(request.route)
+        if bucket:
+            await within(request.deadline, bucket.acquire())
+        if self.bucket:
+            await within(request.deadline, self.bucket.acquire())
+        try:
+            response = await handler(request)
+        except RateLimitExceeded as error:
+            retry_after = parse_retry_after(error.response.headers.get("Retry-After")) if error.response else None
+            for limit in (bucket, self.bucket):
+                if limit:
+                    limit.penalize(retry_after)
+            raise
+        for limit in (bucket, self.bucket):
+            if limit:
+                limit.reward()
+        return response
@@ -21,10 +21,30 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
+_MISSING = object()
+
+
+class ResultList(list):
+    """
+    A list whose dict items have been converted to Result.
+    """
+
+
+def _wrap(value):
+    if isinstance(value, dict) and not isinstance(value, Result):
+        return Result(value)
+    if type(value) is list:
+        return ResultList(Result(item) if isinstance(item, dict) and not isinstance(item, Result) else item for item in value)
+    return value
+
+
 class Result(dict):
     """
     A dotdict that represents the response from the API.
 
+    Nested dicts and lists are converted to Result when they are first
+    accessed, and the converted value replaces the original one.
+
     Args:
         dict (dict): The dictionary to convert to a dotdict.
 
@@ -34,13 +54,59 @@ class Result(dict):
 
     def __init__(self, *args, **kwargs):
         super(Result, self).__init__(*args, **kwargs)
-        for key, value in self.items():
-            if isinstance(value, dict):
-                self[key] = Result(value)
-            elif isinstance(value, list):
-                self[key] = [Result(item) if isinstance(item, dict) else item for item in value]
+
+    def get(self, key, default=None):
+        value = super(Result, self).get(key, _MISSING)
+        if value is _MISSING:
+            return default
+        wrapped = _wrap(value)
+        if wrapped is not value:
+            super(Result, self).__setitem__(key, wrapped)
+        return wrapped
+
+    def _wrap_all(self):
+        for key in list(self):
+            self.get(key)
+
+    def values(self):
+        self._wrap_all()
+        return super(Result, self).values()
+
+    def items(self):
+        self._wrap_all()
+        return super(Result, self).items()
+
+    def __iter__(self):
+        # Overriding __iter__ makes dict(result) and {**result} read values
+        # through __getitem__, so they get converted values as well.
+        return super(Result, self).__iter__()
+
+    def copy(self):
+        self._wrap_all()
+        return super(Result, self).copy()
+
+    def pop(self, key, default=_MISSING):
+        value = super(Result, self).pop(key, _MISSING)
+        if value is _MISSING:
+            if default is _MISSING:
+                raise KeyError(key)
+            return default
+        return _wrap(value)
+
+    def popitem(self):
+        key, value = super(Result, self).popitem()
+        return key, _wrap(value)
+
+    def setdefault(self, key, default=None):
+        if key in self:
+            return self.get(key)
+        return super(Result, self).setdefault(key, default)
 
     def __getattr__(self, attr):
+        # Protocol lookups like __getstate__ or __reduce_ex__ by pickle and
+        # copy must fail, not return None, or the object is not picklable.
+        if attr[:2] == "__" and attr[-2:] == "__":
+            raise AttributeError(attr)
         return self.get(attr, None)
 
     def __getitem__(self, key):
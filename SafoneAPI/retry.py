@@ -0,0 +1,158 @@
+"""
+SafoneAPI v1.0
+Copyright (c) 2025 AsmSafone
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import time
+import random
+import asyncio
+from email.utils import parsedate_to_datetime
+from typing import Iterable, Optional, Tuple, Type
+
+from .errors import (
+    BaseError,
+    TimeoutError,
+    DeadlineExceeded,
+    ConnectionError,
+    RateLimitExceeded,
+)
+from .middleware import Handler, Middleware, Request, Response, match_route
+
+
+class RetryBudget:
+    """
+    Caps retries to a fraction of the traffic.
+
+    Every request deposits `ratio` tokens and every retry withdraws one,
+    so at steady state retries cannot exceed `ratio` of the requests.
+    A small reserve lets a quiet client still retry occasional failures.
+
+    Args:
+        ratio (float): Allowed retries per request.
+        reserve (float): Tokens available before any traffic was seen.
+    """
+
+    def __init__(self, ratio: float = 0.2, reserve: float = 10):
+        self.ratio = ratio
+        self.reserve = reserve
+        self.tokens = reserve
+
+    def deposit(self):
+        self.tokens = min(self.tokens + self.ratio, self.reserve)
+
+    def withdraw(self) -> bool:
+        if self.tokens < 1:
+            return False
+        self.tokens -= 1
+        return True
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Converts a `Retry-After` header, either seconds or an HTTP date, to seconds from now.
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError, IndexError):
+        return None
+
+
+class RetryPolicy(Middleware):
+    """
+    Retries failed calls with exponential backoff and full jitter.
+
+    Only idempotent calls (every `GET`) are retried unless the route is
+    listed in `routes`, so `POST` routes such as `execute` or `paste` must
+    be opted in explicitly. Like other per-route settings, an entry also
+    covers its sub-routes, `telegraph` opting in `telegraph/media`. A
+    `Retry-After` header sent with the error is honoured, and calls whose
+    server asks to wait longer than `max_delay`, or whose deadline would
+    pass during the backoff, fail immediately instead.
+
+    Args:
+        max_attempts (int): Total attempts per call including the first one.
+        base_delay (float): Backoff of the first retry in seconds.
+        max_delay (float): Upper bound of a single backoff in seconds.
+        retry_on (Tuple[Type[BaseError]]): Errors which are worth retrying.
+        routes (Iterable[str]): Non-idempotent routes which may be retried anyway.
+        budget_ratio (float): Allowed retries per request, `None` to disable the budget.
+        budget_reserve (float): Retries available before any traffic was seen.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        base_delay: float = 0.5,
+        max_delay: float = 30,
+        retry_on: Tuple[Type[BaseError], ...] = (RateLimitExceeded, ConnectionError, TimeoutError),
+        routes: Iterable[str] = (),
+        budget_ratio: Optional[float] = 0.2,
+        budget_reserve: float = 10,
+    ):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retry_on = retry_on
+        self.routes = dict.fromkeys(routes, True)
+        self.budget = RetryBudget(budget_ratio, budget_reserve) if budget_ratio is not None else None
+
+    def is_retryable(self, request: Request) -> bool:
+        return request.idempotent or match_route(self.routes, request.route, False)
+
+    def backoff(self, attempt: int, error: BaseError) -> Optional[float]:
+        """
+        Returns the delay before the next attempt, or None if the call should not be retried.
+        """
+        response = error.response
+        retry_after = parse_retry_after(response.headers.get("Retry-After")) if response else None
+        if retry_after is not None:
+            return retry_after if retry_after <= self.max_delay else None
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+    @staticmethod
+    def _before_deadline(request: Request, delay: float) -> bool:
+        return request.deadline is None or time.monotonic() + delay < request.deadline
+
+    async def __call__(self, request: Request, handler: Handler) -> Response:
+        if self.budget:
+            self.budget.deposit()
+        if self.max_attempts <= 1 or not self.is_retryable(request):
+            return await handler(request)
+        attempt = 0
+        while True:
+            try:
+                return await handler(request)
+            except self.retry_on as error:
+                attempt += 1
+                if attempt >= self.max_attempts or isinstance(error, DeadlineExceeded):
+                    raise
+                delay = self.backoff(attempt - 1, error)
+                if delay is None or not self._before_deadline(request, delay):
+                    raise
+                if self.budget and not self.budget.withdraw():
+                    raise
+                await asyncio.sleep(delay)
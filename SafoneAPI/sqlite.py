@@ -0,0 +1,68 @@
+"""
+SafoneAPI v1.0
+Copyright (c) 2025 AsmSafone
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import os
+import sqlite3
+import threading
+from typing import Iterable
+
+
+class SQLiteConnection:
+    """
+    A SQLite connection in WAL mode, shared by the threads of one process.
+
+    The connection is reopened in a process forked after it was opened,
+    as SQLite connections must not cross a fork, so an object holding one
+    can be created before the workers fork and used by all of them. Hold
+    `lock` around `connect()` and every use of the connection it returns.
+
+    Args:
+        path (str): Path of the database file.
+        schema (Iterable[str]): Statements run on every new connection, like `CREATE TABLE IF NOT EXISTS`.
+
+    Attributes:
+        lock (threading.Lock): Serializes the use of the connection.
+    """
+
+    def __init__(self, path: str, schema: Iterable[str] = ()):
+        self.path = path
+        self.schema = tuple(schema)
+        self.lock = threading.Lock()
+        self._db = None
+        self._pid = None
+
+    def connect(self) -> sqlite3.Connection:
+        if self._db is None or self._pid != os.getpid():
+            self._db = sqlite3.connect(self.path, timeout=30, isolation_level=None, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            for statement in self.schema:
+                self._db.execute(statement)
+            self._pid = os.getpid()
+        return self._db
+
+    def close(self):
+        # A connection inherited through a fork belongs to the parent, which closes it.
+        if self._db is not None and self._pid == os.getpid():
+            self._db.close()
+        self._db = None
@@ -0,0 +1,309 @@
+"""
+SafoneAPI v1.0
+Copyright (c) 2025 AsmSafone
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import re
+import json
+import binascii
+from io import BytesIO
+from base64 import b64encode
+from typing import Callable, Optional
+
+MEDIA_KEYS = ("image", "audio")
+
+_MEDIA_KEY = re.compile(rb'"(?:image|audio)"\s*:\s*(\[\s*)?"')
+_NEXT_ITEM = re.compile(rb'\s*,\s*"')
+_BASE64 = b"ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/="
+_PLACEHOLDER = "\x00media:"
+
+_SCAN, _CANDIDATE, _MEDIA, _TEXT, _AFTER = range(5)
+
+
+class Base64Decoder:
+    """
+    Decodes the base64 content of a json string chunk by chunk into a growing buffer.
+
+    Only strings which decode back to exactly the same text are accepted:
+    plain padded base64 whose only json escape is `\\/`. Anything else,
+    like `\\u` escapes or stray characters, makes `feed` or `finish` fail so
+    the caller can keep the string as text, rebuilt by `text()`.
+    """
+
+    def __init__(self):
+        self._out = BytesIO()
+        self._pending = b""
+        self._backslash = False
+
+    def feed(self, chunk: bytes) -> bool:
+        """
+        Decodes a chunk, or returns False without consuming it if the string is not plain base64.
+        """
+        data = b"\\" + chunk if self._backslash else chunk
+        backslash = bool((len(data) - len(data.rstrip(b"\\"))) % 2)
+        if backslash:
+            data = data[:-1]
+        if b"\\" in data:
+            data = data.replace(b"\\/", b"/")
+            if b"\\" in data:
+                return False
+        if data.translate(None, _BASE64):
+            return False
+        pending = self._pending + data
+        pad = pending.find(b"=")
+        if pad >= 0 and (pending[pad:].strip(b"=") or len(pending) - pad > 2):
+            return False
+        # The last quantum is only decoded by finish(), which checks that it round-trips.
+        end = (len(pending) - 1) // 4 * 4 if pending else 0
+        if end:
+            self._out.write(binascii.a2b_base64(pending[:end]))
+        self._pending = pending[end:]
+        self._backslash = backslash
+        return True
+
+    def finish(self) -> Optional[bytes]:
+        """
+        Returns the decoded bytes, or None if the string does not round-trip through base64.
+        """
+        quantum = self._pending
+        if self._backslash or len(quantum) % 4:
+            return None
+        if quantum:
+            tail = binascii.a2b_base64(quantum)
+            if b64encode(tail) != quantum:
+                return None
+            self._out.write(tail)
+            self._pending = b""
+        return self._out.getvalue()
+
+    def text(self) -> bytes:
+        """
+        Returns the json string content fed so far, for strings which turned out not to be base64.
+        """
+        return b64encode(self._out.getvalue()) + self._pending + (b"\\" if self._backslash else b"")
+
+
+class MediaStreamParser:
+    """
+    Incrementally parses a json body, decoding large base64 `image` and
+    `audio` strings as they arrive instead of buffering them.
+
+    Everything else is copied into a small skeleton document which is
+    parsed once the body is complete. Media strings are replaced by
+    their decoded bytes, so the peak memory of a media response is close
+    to the size of the decoded media. Strings shorter than `threshold`,
+    or which turn out not to be base64, are kept as they are and decoded
+    once the response type is known. Media decoded from a response which
+    is not a media type is encoded back to the same text.
+
+    Args:
+        threshold (int): Minimum length of a string to be decoded while streaming.
+        loads (Callable): Json decoder used for the skeleton.
+    """
+
+    def __init__(self, threshold: int = 1024, loads: Callable = json.loads):
+        self.threshold = threshold
+        self.loads = loads
+        self.size = 0
+        self.media = []
+        self._skeleton = bytearray()
+        self._buf = b""
+        self._state = _SCAN
+        self._list = False
+        self._pending = bytearray()
+        self._searched = 0
+        self._escaped = False
+        self._decoder = None
+
+    def feed(self, chunk: bytes):
+        self.size += len(chunk)
+        self._buf += chunk
+        while self._buf and self._step():
+            pass
+
+    def close(self) -> dict:
+        """
+        Parses the skeleton and puts the decoded media in place.
+        Raises ValueError if the body was not valid json.
+        """
+        if self._state in (_CANDIDATE, _MEDIA, _TEXT):
+            raise ValueError("Unterminated string in json body")
+        self._skeleton += self._buf
+        self._buf = b""
+        data = self.loads(bytes(self._skeleton))
+        self._skeleton = bytearray()
+        if self.media:
+            data = self._restore(data)
+        return data
+
+    def _step(self) -> bool:
+        state = self._state
+        if state == _SCAN:
+            match = _MEDIA_KEY.search(self._buf)
+            if not match:
+                keep = min(len(self._buf), 32)
+                self._skeleton += self._buf[:len(self._buf) - keep]
+                self._buf = self._buf[len(self._buf) - keep:]
+                return False
+            self._skeleton += self._buf[:match.end() - 1]
+            self._list = bool(match.group(1))
+            self._buf = self._buf[match.end():]
+            self._state = _CANDIDATE
+            return True
+        if state == _CANDIDATE:
+            return self._candidate()
+        if state == _MEDIA:
+            end = self._buf.find(b'"')
+            if not self._decoder.feed(self._buf if end < 0 else self._buf[:end]):
+                self._to_text()
+                return True
+            if end < 0:
+                self._buf = b""
+                return False
+            self._buf = self._buf[end:]
+            media = self._decoder.finish()
+            if media is None:
+                self._to_text()
+                return True
+            self._buf = self._buf[1:]
+            self._add_media(media)
+            self._decoder = None
+            self._state = _AFTER
+            return True
+        if state == _TEXT:
+            end = self._find_quote(self._buf, 0, self._escaped)
+            if end < 0:
+                self._skeleton += self._buf
+                stripped = self._buf.rstrip(b"\\")
+                trailing = len(self._buf) - len(stripped)
+                self._escaped = (self._escaped if not stripped else False) ^ bool(trailing % 2)
+                self._buf = b""
+                return False
+            self._skeleton += self._buf[:end + 1]
+            self._buf = self._buf[end + 1:]
+            self._state = _AFTER
+            return True
+        if not self._list:
+            self._state = _SCAN
+            return True
+        stripped = self._buf.lstrip()
+        if not stripped:
+            return False
+        match = _NEXT_ITEM.match(self._buf)
+        if match:
+            self._skeleton += self._buf[:match.end() - 1]
+            self._buf = self._buf[match.end():]
+            self._state = _CANDIDATE
+        elif stripped.startswith(b",") and not stripped[1:].strip():
+            return False
+        else:
+            self._list = False
+            self._state = _SCAN
+        return True
+
+    def _candidate(self) -> bool:
+        self._pending += self._buf
+        self._buf = b""
+        end = self._find_quote(self._pending, self._searched, False)
+        if end >= 0:
+            content, self._buf = bytes(self._pending[:end]), bytes(self._pending[end + 1:])
+            self._pending = bytearray()
+            self._searched = 0
+            decoder = Base64Decoder()
+            media = None
+            if len(content) >= self.threshold and decoder.feed(content):
+                media = decoder.finish()
+            if media is not None:
+                self._add_media(media)
+            else:
+                self._skeleton += b'"' + content + b'"'
+            self._state = _AFTER
+            return True
+        self._searched = len(self._pending)
+        if len(self._pending) < self.threshold:
+            return False
+        pending, self._pending = bytes(self._pending), bytearray()
+        self._searched = 0
+        decoder = Base64Decoder()
+        if decoder.feed(pending):
+            self._decoder = decoder
+            self._state = _MEDIA
+        else:
+            self._skeleton += b'"' + pending
+            stripped = pending.rstrip(b"\\")
+            self._escaped = bool((len(pending) - len(stripped)) % 2)
+            self._state = _TEXT
+        return False
+
+    def _to_text(self):
+        # The string is not media after all: copy what was decoded so far back as text.
+        text = self._decoder.text()
+        self._skeleton += b'"' + text
+        self._escaped = bool((len(text) - len(text.rstrip(b"\\"))) % 2)
+        self._decoder = None
+        self._state = _TEXT
+
+    @staticmethod
+    def _find_quote(data, start: int, escaped: bool) -> int:
+        while True:
+            end = data.find(b'"', start)
+            if end < 0:
+                return -1
+            slashes = 0
+            index = end - 1
+            while index >= 0 and data[index] == 0x5C:
+                slashes += 1
+                index -= 1
+            if index < 0 and escaped:
+                slashes += 1
+            if not slashes % 2:
+                return end
+            start = end + 1
+
+    def _add_media(self, media: bytes):
+        self._skeleton += b'"\\u0000media:%d"' % len(self.media)
+        self.media.append(media)
+
+    def _media_for(self, value):
+        if isinstance(value, str) and value.startswith(_PLACEHOLDER):
+            return self.media[int(value[len(_PLACEHOLDER):])]
+        return value
+
+    def _restore(self, data):
+        type = data.get("type") if isinstance(data, dict) else None
+        if type and ("image" in type or "audio" in type):
+            for key in MEDIA_KEYS:
+                value = data.get(key)
+                if isinstance(value, list):
+                    data[key] = [self._media_for(item) for item in value]
+                elif value is not None:
+                    data[key] = self._media_for(value)
+        return self._reencode(data)
+
+    def _reencode(self, value):
+        if isinstance(value, dict):
+            for key, item in value.items():
+                value[key] = self._reencode(item)
+        elif isinstance(value, list):
+            value[:] = [self._reencode(item) for item in value]
+        elif isinstance(value, str) and value.startswith(_PLACEHOLDER):
+            return b64encode(self._media_for(value)).decode()
+        return value
@@ -0,0 +1,218 @@
+"""
+SafoneAPI v1.0
+Copyright (c) 2025 AsmSafone
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import os
+import asyncio
+import inspect
+import functools
+import threading
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Iterator, Union
+
+from .api import SafoneAPI
+from .timeouts import current_deadline, deadline, remaining
+
+_ITERATORS = ("map", "iter_udemy", "iter_search")
+_TAKES_METHOD = ("map", "batch", "iter_search")
+
+
+async def _call(func: Callable[..., Awaitable], at: float, args: tuple, kwargs: dict) -> Any:
+    if at is None:
+        return await func(*args, **kwargs)
+    with deadline(remaining(at)):
+        return await func(*args, **kwargs)
+
+
+def _unwrap(method: Any) -> Any:
+    # Methods of the facade block, so they are handed to the client by name.
+    if isinstance(getattr(method, "__self__", None), SafoneAPISync):
+        return method.__name__
+    return method
+
+
+def _by_name(name: str, args: tuple, kwargs: dict) -> tuple:
+    if name in _TAKES_METHOD:
+        if args:
+            args = (_unwrap(args[0]),) + args[1:]
+        elif "method" in kwargs:
+            kwargs = dict(kwargs, method=_unwrap(kwargs["method"]))
+    return args, kwargs
+
+
+def _blocking(name: str, func: Callable) -> Callable:
+    @functools.wraps(func)
+    def method(self, *args, **kwargs):
+        return self.submit(name, *args, **kwargs).result()
+
+    return method
+
+
+def _iterating(name: str, func: Callable) -> Callable:
+    @functools.wraps(func)
+    def method(self, *args, **kwargs):
+        return self._iterate(name, args, kwargs)
+
+    method.__signature__ = inspect.signature(func).replace(return_annotation=Iterator[Any])
+    return method
+
+
+def generate_blocking(cls: type) -> type:
+    """
+    Adds a blocking twin to `cls` for every public coroutine method and async iterator of `SafoneAPI`.
+    """
+    for name, func in vars(SafoneAPI).items():
+        if name.startswith("_") or name == "close" or name in cls.__dict__:
+            continue
+        if name in _ITERATORS:
+            setattr(cls, name, _iterating(name, func))
+        elif inspect.iscoroutinefunction(func):
+            setattr(cls, name, _blocking(name, func))
+    return cls
+
+
+@generate_blocking
+class SafoneAPISync:
+    """
+    Blocking facade of `SafoneAPI` for synchronous code like Flask views,
+    Celery tasks or scripts.
+
+    One daemon thread runs an event loop which owns the client and its
+    pooled session, so every call reuses the same connections instead of
+    opening a new loop and session like `asyncio.run(api.weather(...))`.
+    Every endpoint is available as a blocking method with the same
+    signature, and any number of threads may call them at once. `submit`
+    returns a `concurrent.futures.Future` to run calls in parallel, and
+    `map`, `iter_udemy` and `iter_search` return plain iterators.
+
+    The loop is started on first use and restarted in a forked child, so
+    an instance created before Celery or gunicorn fork its workers works
+    in each of them. Calling the facade from a callback that runs on its
+    own loop raises RuntimeError instead of deadlocking.
+
+    Args:
+        *args: Passed to `SafoneAPI`.
+        **kwargs: Passed to `SafoneAPI`.
+
+    Attributes:
+        client (SafoneAPI): The asynchronous client running on the background loop.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self._args = args
+        self._kwargs = kwargs
+        self._lock = threading.Lock()
+        self._loop = None
+        self._thread = None
+        self._client = None
+        self._pid = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    @property
+    def client(self) -> SafoneAPI:
+        return self._start()[1]
+
+    def _start(self):
+        with self._lock:
+            if self._loop is None or self._pid != os.getpid():
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(target=self._run_loop, args=(loop,), name="SafoneAPISync", daemon=True)
+                thread.start()
+                self._client = asyncio.run_coroutine_threadsafe(self._create(), loop).result()
+                self._loop, self._thread, self._pid = loop, thread, os.getpid()
+            return self._loop, self._client
+
+    @staticmethod
+    def _run_loop(loop: asyncio.AbstractEventLoop):
+        asyncio.set_event_loop(loop)
+        loop.run_forever()
+
+    async def _create(self) -> SafoneAPI:
+        return SafoneAPI(*self._args, **self._kwargs)
+
+    def _run(self, coro: Awaitable, loop: asyncio.AbstractEventLoop) -> Future:
+        if threading.current_thread() is self._thread:
+            coro.close()
+            raise RuntimeError("SafoneAPISync can't be called from its own event loop, await the client instead")
+        return asyncio.run_coroutine_threadsafe(coro, loop)
+
+    def submit(self, method: Union[str, Callable], *args, **kwargs) -> Future:
+        """
+        Schedules an endpoint call on the background loop without waiting for it.
+
+                Parameters:
+                        method (Union[str, Callable]): Endpoint name or method, like "weather" or api.weather
+                        *args, **kwargs: Arguments of the endpoint
+                Returns:
+                        concurrent.futures.Future holding the result or the raised error
+
+        """
+        loop, client = self._start()
+        func = client._resolve(_unwrap(method))
+        args, kwargs = _by_name(getattr(func, "__name__", None), args, kwargs)
+        return self._run(_call(func, current_deadline(), args, kwargs), loop)
+
+    def _iterate(self, name: str, args: tuple, kwargs: dict) -> Iterator[Any]:
+        loop, client = self._start()
+        args, kwargs = _by_name(name, args, kwargs)
+        at = current_deadline()
+        iterator = getattr(client, name)(*args, **kwargs)
+        try:
+            while True:
+                try:
+                    yield self._run(_call(iterator.__anext__, at, (), {}), loop).result()
+                except StopAsyncIteration:
+                    return
+        finally:
+            self._run(iterator.aclose(), loop).result()
+
+    def deadline(self, seconds: float):
+        """
+        Limits every call made by this thread inside the `with` block to `seconds` from now.
+
+                Parameters:
+                        seconds (float): Time budget of the block
+                Returns:
+                        Context manager, calls raise DeadlineExceeded once the budget is spent
+
+        """
+        return deadline(seconds)
+
+    def close(self):
+        """
+        Closes the client session and stops the background loop.
+        """
+        with self._lock:
+            loop, thread, client = self._loop, self._thread, self._client
+            forked = self._pid != os.getpid()
+            self._loop = self._thread = self._client = None
+        if loop is None or forked:
+            return
+        asyncio.run_coroutine_threadsafe(client.close(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
@@ -0,0 +1,50 @@
+"""
+SafoneAPI v1.0
+Copyright (c) 2025 AsmSafone
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from pyrogram.types import Message, User  # noqa: F401
+
+
+def is_message(obj: Any) -> bool:
+    """
+    Tells whether `obj` looks like a `pyrogram.types.Message`, without importing pyrogram.
+    """
+    if obj is None or isinstance(obj, (str, bytes, dict)):
+        return False
+    return hasattr(obj, "from_user") and hasattr(obj, "text") and hasattr(obj, "caption")
+
+
+def message_text(message: Any) -> str:
+    """
+    Returns the text of a message, or its caption for media messages.
+    """
+    return message.text or message.caption or ""
+
+
+def full_name(user: Any) -> str:
+    """
+    Returns the first and last name of a `pyrogram.types.User`.
+    """
+    return f"{user.first_name} {user.last_name or ''}".rstrip()
@@ -0,0 +1,124 @@
+"""
+SafoneAPI v1.0
+Copyright (c) 2025 AsmSafone
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import time
+import asyncio
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional, Union
+
+import aiohttp
+
+from .errors import DeadlineExceeded
+
+_deadline = ContextVar("safoneapi_deadline", default=None)
+
+
+class Timeout:
+    """
+    Timeouts of the phases of a single attempt.
+
+    Args:
+        total (float): Seconds for the whole attempt, including reading the body.
+        connect (float): Seconds to get a connection, from the pool or a new one.
+        sock_read (float): Seconds to wait for the next chunk of the response.
+    """
+
+    __slots__ = ("total", "connect", "sock_read")
+
+    def __init__(self, total: float = 60, connect: float = None, sock_read: float = None):
+        self.total = total
+        self.connect = connect
+        self.sock_read = sock_read
+
+    @classmethod
+    def of(cls, value: Union["Timeout", float]) -> "Timeout":
+        return value if isinstance(value, Timeout) else cls(value)
+
+    def client_timeout(self, remaining: float = None) -> aiohttp.ClientTimeout:
+        """
+        Returns the aiohttp timeout of an attempt, shortened to the time left until the deadline.
+        """
+        total = self.total
+        if remaining is not None:
+            total = remaining if total is None else min(total, remaining)
+        return aiohttp.ClientTimeout(total=total, connect=self.connect, sock_read=self.sock_read)
+
+    def __repr__(self):
+        return f"<Timeout total={self.total} connect={self.connect} sock_read={self.sock_read}>"
+
+
+SHORT = Timeout(total=15, connect=5, sock_read=10)
+DEFAULT = Timeout(total=60, connect=10, sock_read=45)
+LONG = Timeout(total=180, connect=10, sock_read=150)
+
+
+@contextmanager
+def deadline(seconds: float) -> Iterator[float]:
+    """
+    Limits every call made in the block, retries and queueing included, to `seconds` from now.
+    Nested deadlines can only shorten the outer one.
+    """
+    at = time.monotonic() + seconds
+    outer = _deadline.get()
+    token = _deadline.set(at if outer is None else min(outer, at))
+    try:
+        yield at
+    finally:
+        _deadline.reset(token)
+
+
+def current_deadline() -> Optional[float]:
+    """
+    Returns the monotonic time the calls of the current task must finish by, if any.
+    """
+    return _deadline.get()
+
+
+def remaining(at: Optional[float]) -> Optional[float]:
+    """
+    Returns the seconds left until a deadline, raising DeadlineExceeded once it passed.
+    """
+    if at is None:
+        return None
+    left = at - time.monotonic()
+    if left <= 0:
+        raise DeadlineExceeded
+    return left
+
+
+async def within(at: Optional[float], awaitable):
+    """
+    Awaits `awaitable`, raising DeadlineExceeded if the deadline passes first.
+    """
+    if at is None:
+        return await awaitable
+    left = at - time.monotonic()
+    if left <= 0:
+        if asyncio.iscoroutine(awaitable):
+            awaitable.close()
+        raise DeadlineExceeded
+    try:
+        return await asyncio.wait_for(awaitable, left)
+    except asyncio.TimeoutError:
+        raise DeadlineExceeded
@@ -0,0 +1,204 @@
+"""
+SafoneAPI v1.0
+Copyright (c) 2025 AsmSafone
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import time
+from typing import Dict, List, Optional, Tuple
+
+import aiohttp
+
+PHASES = ("queue", "dns", "connect", "send", "ttfb", "read", "parse", "decode")
+
+
+class Span:
+    """
+    Timings of a single call, delivered to the trace callback once it finished.
+
+    Phases are recorded as `(name, offset, duration)` events in seconds,
+    relative to `start`, and appear once per attempt:
+
+    - `queue`: waiting for a free connection of the pool.
+    - `dns`: resolving the host, skipped on a dns cache hit.
+    - `connect`: opening the connection, TLS handshake included.
+    - `send`: writing the request headers and body.
+    - `ttfb`: waiting for the response headers after sending.
+    - `read`: downloading the response body.
+    - `parse`: decoding the json body, which overlaps `read` for bodies parsed while streaming.
+    - `decode`: decoding media and building the Result.
+
+    Attributes:
+        method (str): The HTTP method.
+        route (str): The api route.
+        start (float): Unix time the call started at.
+        duration (float): Seconds the whole call took.
+        status (int): HTTP status of the last response, if any.
+        error (str): Class name of the error the call failed with, if any.
+        attempts (int): Number of HTTP requests sent.
+        events (List[Tuple[str, float, float]]): The recorded phases.
+    """
+
+    __slots__ = ("method", "route", "start", "duration", "status", "error", "attempts", "events", "_origin", "_marks")
+
+    def __init__(self, method: str, route: str):
+        self.method = method
+        self.route = route
+        self.start = time.time()
+        self.duration = 0.0
+        self.status = None
+        self.error = None
+        self.attempts = 0
+        self.events: List[Tuple[str, float, float]] = []
+        self._origin = time.perf_counter()
+        self._marks: Dict[str, float] = {}
+
+    def now(self) -> float:
+        """
+        Returns the seconds elapsed since the call started.
+        """
+        return time.perf_counter() - self._origin
+
+    def add(self, name: str, offset: float, duration: float):
+        self.events.append((name, offset, duration))
+
+    def begin(self, name: str):
+        self._marks[name] = self.now()
+
+    def end(self, name: str) -> Optional[float]:
+        started = self._marks.pop(name, None)
+        if started is None:
+            return None
+        now = self.now()
+        self.add(name, started, now - started)
+        return now
+
+    @property
+    def phases(self) -> Dict[str, float]:
+        """
+        Total seconds spent in each phase, over all attempts.
+        """
+        phases = {}
+        for name, _, duration in self.events:
+            phases[name] = phases.get(name, 0.0) + duration
+        return phases
+
+    def __repr__(self):
+        return f"<Span {self.method} {self.route} duration={self.duration:.4f}>"
+
+
+def _hook(action: str, name: str):
+    async def hook(session, context, params):
+        span = context.trace_request_ctx
+        if isinstance(span, Span):
+            getattr(span, action)(name)
+    return hook
+
+
+async def _on_request_start(session, context, params):
+    span = context.trace_request_ctx
+    if isinstance(span, Span):
+        span.attempts += 1
+        span.begin("send")
+
+
+async def _on_connection_ready(session, context, params):
+    span = context.trace_request_ctx
+    if isinstance(span, Span):
+        span.begin("send")
+
+
+async def _on_request_sent(session, context, params):
+    span = context.trace_request_ctx
+    if isinstance(span, Span):
+        span._marks["sent"] = span.now()
+
+
+async def _on_request_end(session, context, params):
+    span = context.trace_request_ctx
+    if isinstance(span, Span):
+        sent = span._marks.pop("sent", None)
+        started = span._marks.pop("send", None)
+        now = span.now()
+        if sent is not None:
+            if started is not None:
+                span.add("send", started, sent - started)
+            span.add("ttfb", sent, now - sent)
+
+
+def trace_config() -> aiohttp.TraceConfig:
+    """
+    Returns the aiohttp hooks recording the connection phases into the Span passed as `trace_request_ctx`.
+    """
+    config = aiohttp.TraceConfig()
+    config.on_request_start.append(_on_request_start)
+    config.on_connection_queued_start.append(_hook("begin", "queue"))
+    config.on_connection_queued_end.append(_hook("end", "queue"))
+    config.on_dns_resolvehost_start.append(_hook("begin", "dns"))
+    config.on_dns_resolvehost_end.append(_hook("end", "dns"))
+    config.on_connection_create_start.append(_hook("begin", "connect"))
+    config.on_connection_create_end.append(_hook("end", "connect"))
+    config.on_connection_create_end.append(_on_connection_ready)
+    config.on_connection_reuseconn.append(_on_connection_ready)
+    if hasattr(config, "on_request_headers_sent"):
+        config.on_request_headers_sent.append(_on_request_sent)
+    config.on_request_chunk_sent.append(_on_request_sent)
+    config.on_request_end.append(_on_request_end)
+    return config
+
+
+class OpenTelemetryExporter:
+    """
+    Forwards finished spans to OpenTelemetry, one span per call with a child span per phase.
+
+    Requires the `opentelemetry-api` package and a configured tracer provider.
+
+    Args:
+        tracer (opentelemetry.trace.Tracer): Tracer to create the spans with, the global one by default.
+    """
+
+    def __init__(self, tracer=None):
+        from opentelemetry import trace
+
+        self._trace = trace
+        self.tracer = tracer or trace.get_tracer("SafoneAPI")
+
+    def __call__(self, span: Span):
+        trace = self._trace
+        start = int(span.start * 1e9)
+        root = self.tracer.start_span(
+            f"{span.method} {span.route}",
+            kind=trace.SpanKind.CLIENT,
+            start_time=start,
+            attributes={
+                "http.method": span.method,
+                "safoneapi.route": span.route,
+                "safoneapi.attempts": span.attempts,
+            },
+        )
+        if span.status is not None:
+            root.set_attribute("http.status_code", span.status)
+        if span.error:
+            root.set_status(trace.Status(trace.StatusCode.ERROR, span.error))
+        context = trace.set_span_in_context(root)
+        for name, offset, duration in span.events:
+            child = self.tracer.start_span(name, context=context, start_time=start + int(offset * 1e9))
+            child.end(end_time=start + int((offset + duration) * 1e9))
+        root.end(end_time=start + int(span.duration * 1e9))
@@ -0,0 +1,136 @@
+"""
+SafoneAPI v1.0
+Copyright (c) 2025 AsmSafone
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import os
+from typing import AsyncIterable, BinaryIO, List, Optional, Tuple, Union
+
+import aiohttp
+
+from .errors import InvalidRequest
+
+FileInput = Union[str, os.PathLike, BinaryIO, bytes, bytearray, memoryview, AsyncIterable[bytes]]
+
+
+class Upload:
+    """
+    A file to send in a multipart body without reading it into memory.
+
+    Paths are opened for every attempt and read in chunks by aiohttp off
+    the event loop, seekable file objects are rewound to where they were,
+    bytes and memoryviews are sent without copying, and async byte
+    iterators are streamed as they produce data (and can only be sent once).
+
+    Args:
+        source (FileInput): Path, binary file object, bytes-like object or async byte iterator.
+        filename (str): Name sent with the file, taken from the path when possible.
+    """
+
+    def __init__(self, source: FileInput, filename: str = None):
+        if isinstance(source, Upload):
+            source, filename = source.source, filename or source.filename
+        self.source = source
+        self.filename = filename or self._guess_name(source)
+        self._position = None
+        self._opened = []
+        self._sent = False
+        if hasattr(source, "seek") and hasattr(source, "tell"):
+            try:
+                self._position = source.tell()
+            except (OSError, ValueError):
+                self._position = None
+
+    @staticmethod
+    def _guess_name(source) -> str:
+        if isinstance(source, (str, os.PathLike)):
+            return os.path.basename(os.fspath(source))
+        name = getattr(source, "name", None)
+        if isinstance(name, str):
+            return os.path.basename(name)
+        return "file"
+
+    @property
+    def size(self) -> Optional[int]:
+        """
+        Size of the file in bytes, if it can be known without reading it.
+        """
+        source = self.source
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            return source.nbytes if isinstance(source, memoryview) else len(source)
+        try:
+            if isinstance(source, (str, os.PathLike)):
+                return os.path.getsize(source)
+            if hasattr(source, "fileno"):
+                return os.fstat(source.fileno()).st_size - (self._position or 0)
+        except (OSError, ValueError):
+            pass
+        return None
+
+    def open(self):
+        """
+        Returns a value aiohttp can stream for one attempt.
+        """
+        source = self.source
+        if isinstance(source, (str, os.PathLike)):
+            file = open(source, "rb")
+            self._opened.append(file)
+            return file
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            return source
+        if hasattr(source, "read"):
+            if self._sent:
+                if self._position is None:
+                    raise InvalidRequest("The file object can not be sent again, it is not seekable")
+                source.seek(self._position)
+            self._sent = True
+            return source
+        if hasattr(source, "__aiter__"):
+            if self._sent:
+                raise InvalidRequest("The async iterator has already been consumed")
+            self._sent = True
+            return source
+        raise InvalidRequest("Please provide a file path, file object, bytes or an async iterator")
+
+    def close(self):
+        for file in self._opened:
+            file.close()
+        self._opened.clear()
+
+
+def build_form(data: dict) -> Tuple[aiohttp.FormData, List[Upload]]:
+    """
+    Builds the multipart body of a call, returning the uploads to close once it was sent.
+    """
+    form = aiohttp.FormData()
+    uploads = []
+    try:
+        for name, value in data.items():
+            if isinstance(value, Upload):
+                uploads.append(value)
+                form.add_field(name, value.open(), filename=value.filename)
+            else:
+                form.add_field(name, value)
+    except BaseException:
+        for upload in uploads:
+            upload.close()
+        raise
+    return form, uploads
@@ -0,0 +1,342 @@
+"""
+SafoneAPI v1.0
+Copyright (c) 2025 AsmSafone
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+# Offline benchmarks of the client against benchmarks/server.py.
+#
+#   python benchmarks/run.py              run and compare with baseline.json
+#   python benchmarks/run.py --save       run and store the results as the new baseline
+#   python benchmarks/run.py --quick      fewer iterations, for a rough check
+
+import os
+import sys
+import json
+import time
+import socket
+import asyncio
+import argparse
+import platform
+import subprocess
+import tracemalloc
+import multiprocessing
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, HERE)
+
+import server  # noqa: E402
+from SafoneAPI import SafoneAPI, JSONCodec, LoopLagMonitor, MemoryCache, RateLimiter, Request, Response, ResponseCache, Result  # noqa: E402,E501
+
+BASELINE = os.path.join(HERE, "baseline.json")
+
+# Whether a higher value is better, keyed by unit.
+HIGHER_IS_BETTER = {"calls/s": True, "us": False, "ms": False, "KB": False, "MB": False}
+
+
+class EagerResult(dict):
+    # Result as it was before nested values were converted on first access.
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        for key, value in self.items():
+            if isinstance(value, dict):
+                self[key] = EagerResult(value)
+            elif isinstance(value, list):
+                self[key] = [EagerResult(item) if isinstance(item, dict) else item for item in value]
+
+    def __getattr__(self, attr):
+        return self.get(attr)
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _percentile(samples, fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def _per_call(func, number: int) -> float:
+    started = time.perf_counter()
+    for _ in range(number):
+        func()
+    return (time.perf_counter() - started) / number * 1e6
+
+
+async def _latencies(call, number: int):
+    samples = []
+    for _ in range(number):
+        started = time.perf_counter()
+        await call()
+        samples.append(time.perf_counter() - started)
+    return samples
+
+
+async def _throughput(call, number: int, concurrency: int) -> float:
+    queue = iter(range(number))
+
+    async def worker():
+        for _ in queue:
+            await call()
+
+    started = time.perf_counter()
+    await asyncio.gather(*[worker() for _ in range(concurrency)])
+    return number / (time.perf_counter() - started)
+
+
+def _allocated(func) -> float:
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        value = func()  # noqa: F841, kept alive until measured
+        return (tracemalloc.get_traced_memory()[0] - before) / 1024
+    finally:
+        tracemalloc.stop()
+
+
+async def _peak_memory(call) -> float:
+    tracemalloc.start()
+    try:
+        await call()
+        return tracemalloc.get_traced_memory()[1] / 1024 / 1024
+    finally:
+        tracemalloc.stop()
+
+
+async def network(url: str, scale: float) -> dict:
+    results = {}
+    n = lambda count: max(10, int(count * scale))  # noqa: E731
+    async with SafoneAPI(url, coalesce=False, metrics=False, breaker=False) as api:
+        await api.ipinfo("1.1.1.1")
+
+        samples = await _latencies(lambda: api.ipinfo("1.1.1.1"), n(1000))
+        results["fetch_small.p50"] = (_percentile(samples, 0.5) * 1e6, "us")
+        results["fetch_small.p99"] = (_percentile(samples, 0.99) * 1e6, "us")
+        samples = await _latencies(lambda: api.translate("hello", "bn"), n(1000))
+        results["post_json_small.p50"] = (_percentile(samples, 0.5) * 1e6, "us")
+        results["fetch_small.throughput"] = (await _throughput(lambda: api.ipinfo("1.1.1.1"), n(5000), 50), "calls/s")
+        results["post_json_small.throughput"] = (
+            await _throughput(lambda: api.translate("hello", "bn"), n(5000), 50), "calls/s"
+        )
+
+        samples = await _latencies(lambda: api.google("query", 100), n(200))
+        results["fetch_search.p50"] = (_percentile(samples, 0.5) * 1e3, "ms")
+        samples = await _latencies(lambda: api.imagine("a cat", 4), n(50))
+        results["fetch_images.p50"] = (_percentile(samples, 0.5) * 1e3, "ms")
+        samples = await _latencies(lambda: api.speech("hello", "narrator"), n(50))
+        results["fetch_audio.p50"] = (_percentile(samples, 0.5) * 1e3, "ms")
+
+        results["fetch_images.peak"] = (await _peak_memory(lambda: api.imagine("a cat", 4)), "MB")
+        results["fetch_search.peak"] = (await _peak_memory(lambda: api.google("query", 100)), "MB")
+    return results
+
+
+# Median of the worst event loop stall per round of concurrent image calls,
+# with media decoding offloaded to the executor and done on the loop.
+async def loop_lag(url: str, scale: float) -> dict:
+    results = {}
+    rounds = max(5, int(20 * scale))
+    for label, threshold in (("offload", 128 * 1024), ("inline", None)):
+        async with SafoneAPI(url, coalesce=False, metrics=False, breaker=False, offload_threshold=threshold) as api:
+            await api.imagine("a cat", 4)
+            samples = []
+            for _ in range(rounds):
+                async with LoopLagMonitor(interval=0.001) as monitor:
+                    await asyncio.gather(*[api.imagine("a cat", 4) for _ in range(8)])
+                samples.append(monitor.max_lag)
+            results[f"loop_lag_images.{label}"] = (_percentile(samples, 0.5) * 1e3, "ms")
+    return results
+
+
+def offline(scale: float) -> dict:
+    results = {}
+    n = lambda count: max(10, int(count * scale))  # noqa: E731
+    small = json.loads(server.SMALL)
+    search = json.loads(server.SEARCH)
+    images = json.loads(server.IMAGES)
+
+    results["parse_result_small"] = (_per_call(lambda: SafoneAPI._parse_result(dict(small)), n(50000)), "us")
+    results["parse_result_search"] = (_per_call(lambda: SafoneAPI._parse_result(dict(search)), n(50000)), "us")
+    results["parse_result_images"] = (_per_call(lambda: SafoneAPI._parse_result(images), n(100)) / 1000, "ms")
+
+    def walk(cls):
+        result = cls(search)
+        for item in result.results:
+            item.meta.rank
+
+    results["result_walk_search"] = (_per_call(lambda: walk(Result), n(2000)), "us")
+    results["result_walk_search.eager"] = (_per_call(lambda: walk(EagerResult), n(2000)), "us")
+    for name, cls in (("lazy", Result), ("eager", EagerResult)):
+        results[f"result_build_search.{name}"] = (_per_call(lambda: cls(search), n(20000)), "us")
+        results[f"result_build_search.{name}_alloc"] = (_allocated(lambda: cls(search)), "KB")
+
+    for codec in {JSONCodec.auto().name: JSONCodec.auto(), "json": JSONCodec.stdlib()}.values():
+        results[f"loads_search.{codec.name}"] = (_per_call(lambda: codec.loads(server.SEARCH), n(500)), "us")
+        results[f"loads_images.{codec.name}"] = (_per_call(lambda: codec.loads(server.IMAGES), n(20)) / 1000, "ms")
+
+    async def send(request):
+        return Response(200, None, {"city": "Dhaka", "temperature": 30}, 40)
+
+    def client(**kwargs):
+        # The client with its request engine in front of a stub _send.
+        api = SafoneAPI(**kwargs)
+        api._send = send
+        api._build_chain()
+        return api
+
+    async def overhead(call, bare, number: int) -> float:
+        started = time.perf_counter()
+        for _ in range(number):
+            await bare()
+        direct = time.perf_counter() - started
+        started = time.perf_counter()
+        for _ in range(number):
+            await call()
+        return (time.perf_counter() - started - direct) / number * 1e6
+
+    async def bare_call():
+        return SafoneAPI._parse_result((await send(request)).data)
+
+    async def chain_overhead():
+        number = n(100000)
+        default = client()
+        full = client(cache=ResponseCache(MemoryCache()), hedge=True, rate_limiter=RateLimiter(rate=1e9))
+        return {
+            "chain_overhead": (await overhead(lambda: default._handler(request), lambda: send(request), number), "us"),
+            "chain_overhead.all": (await overhead(lambda: full._handler(request), lambda: send(request), number), "us"),
+            "call_overhead": (await overhead(lambda: default.weather("Dhaka"), bare_call, number), "us"),
+        }
+
+    # Against a bare _send, as the old helpers called the session directly.
+    request = Request("GET", "weather", params={"city": "Dhaka", "type": "text"})
+    results.update(asyncio.run(chain_overhead()))
+    return results
+
+
+# ru_maxrss survives exec on Linux, so the probe reads the current rss instead.
+IMPORT_PROBE = """
+import os, sys, time, resource
+def rss():
+    try:
+        with open("/proc/self/statm") as file:
+            return int(file.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 1024 / 1024
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+before = rss()
+started = time.perf_counter()
+for name in sys.argv[1:]:
+    __import__(name)
+elapsed = time.perf_counter() - started
+print(elapsed, rss() - before)
+"""
+
+
+def _import_cost(*modules: str, runs: int = 5):
+    samples = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", IMPORT_PROBE, *modules],
+            cwd=ROOT,
+            check=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        ).stdout.split()
+        samples.append((float(output[0]), float(output[1])))
+    return _percentile([s[0] for s in samples], 0.5) * 1e3, _percentile([s[1] for s in samples], 0.5)
+
+
+def startup() -> dict:
+    results = {}
+    elapsed, rss = _import_cost("SafoneAPI")
+    results["import.time"] = (elapsed, "ms")
+    results["import.rss"] = (rss, "MB")
+    try:
+        elapsed, rss = _import_cost("SafoneAPI", "pyrogram.types", runs=3)
+    except subprocess.CalledProcessError:
+        return results
+    results["import_with_pyrogram.time"] = (elapsed, "ms")
+    results["import_with_pyrogram.rss"] = (rss, "MB")
+    return results
+
+
+def compare(results: dict, baseline: dict):
+    width = max(len(name) for name in results)
+    print(f"{'benchmark':<{width}}  {'value':>17}  {'baseline':>17}  {'change':>8}")
+    for name, (value, unit) in results.items():
+        old = baseline.get(name)
+        line = f"{name:<{width}}  {value:>9.2f} {unit:<7}"
+        if old:
+            change = (value - old[0]) / old[0] * 100 if old[0] else 0.0
+            worse = change < 0 if HIGHER_IS_BETTER.get(unit) else change > 0
+            flag = "  !" if worse and abs(change) >= 20 else ""
+            line += f"  {old[0]:>9.2f} {old[1]:<7}  {change:>+7.1f}%{flag}"
+        print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline benchmarks of the SafoneAPI client.")
+    parser.add_argument("--save", action="store_true", help="store the results as the new baseline")
+    parser.add_argument("--quick", action="store_true", help="run a tenth of the iterations")
+    parser.add_argument("--baseline", default=BASELINE, help="baseline file to compare with or save to")
+    args = parser.parse_args()
+    scale = 0.1 if args.quick else 1.0
+
+    port = _free_port()
+    process = multiprocessing.Process(target=server.serve, args=(port,), daemon=True)
+    process.start()
+    try:
+        url = f"http://127.0.0.1:{port}/"
+        for _ in range(100):
+            try:
+                socket.create_connection(("127.0.0.1", port), timeout=0.1).close()
+                break
+            except OSError:
+                time.sleep(0.05)
+        results = asyncio.run(network(url, scale))
+        results.update(asyncio.run(loop_lag(url, scale)))
+    finally:
+        process.terminate()
+        process.join()
+    results.update(offline(scale))
+    results.update(startup())
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as file:
+            baseline = json.load(file).get("results", {})
+    compare(results, baseline)
+    if args.save:
+        with open(args.baseline, "w") as file:
+            json.dump({
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "codec": JSONCodec.auto().name,
+                "results": {name: [round(value, 3), unit] for name, (value, unit) in results.items()},
+            }, file, indent=2)
+            file.write("\n")
+
+
+if __name__ == "__main__":
+    main()
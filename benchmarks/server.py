@@ -0,0 +1,96 @@
+"""
+SafoneAPI v1.0
+Copyright (c) 2025 AsmSafone
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+# A local stand-in for api.safone.co serving responses shaped like the real
+# ones. Run it alone with `python benchmarks/server.py [port]`, or let run.py
+# start it.
+
+import sys
+import json
+import base64
+import random
+
+from aiohttp import web
+
+random.seed(0)
+
+
+def _b64(size: int) -> str:
+    return base64.b64encode(random.getrandbits(8 * size).to_bytes(size, "little")).decode()
+
+
+def _search(count: int) -> dict:
+    return {
+        "results": [
+            {
+                "title": f"Result number {index} about the query",
+                "link": f"https://example.com/{index}",
+                "description": "A short snippet of the page text. " * 4,
+                "meta": {"rank": index, "tags": ["python", "asyncio", "api"]},
+            }
+            for index in range(count)
+        ]
+    }
+
+
+SMALL = json.dumps({
+    "ip": "1.1.1.1",
+    "country": "Australia",
+    "city": "Sydney",
+    "isp": "Cloudflare, Inc.",
+    "lat": -33.86,
+    "lon": 151.2,
+}).encode()
+SEARCH = json.dumps(_search(100)).encode()
+IMAGES = json.dumps({"type": "image/png", "image": [_b64(256 * 1024) for _ in range(4)]}).encode()
+AUDIO = json.dumps({"type": "audio/mpeg", "audio": _b64(1024 * 1024)}).encode()
+
+BODIES = {
+    "ipinfo": SMALL,
+    "translate": SMALL,
+    "google": SEARCH,
+    "imagine": IMAGES,
+    "speech": AUDIO,
+}
+
+
+async def handler(request: web.Request) -> web.Response:
+    route = request.match_info["route"]
+    if request.method == "POST":
+        await request.read()
+    body = BODIES.get(route, SMALL)
+    return web.Response(body=body, content_type="application/json")
+
+
+def make_app() -> web.Application:
+    app = web.Application(client_max_size=64 * 1024 * 1024)
+    app.router.add_route("*", "/{route:.*}", handler)
+    return app
+
+
+def serve(port: int):
+    web.run_app(make_app(), host="127.0.0.1", port=port, print=None, access_log=None)
+
+
+if __name__ == "__main__":
+    serve(int(sys.argv[1]) if len(sys.argv) > 1 else 8800)
@@ -0,0 +1,54 @@
+"""
+SafoneAPI v1.0
+Copyright (c) 2025 AsmSafone
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import asyncio
+import time
+
+from SafoneAPI.breaker import CircuitBreaker
+from SafoneAPI.errors import ConnectionError
+from SafoneAPI.middleware import Request
+
+
+async def _failing(request):
+    raise ConnectionError
+
+
+def test_reading_states_does_not_change_circuits():
+    changes = []
+    breaker = CircuitBreaker(min_calls=2, reset_timeout=0.05, on_change=lambda *change: changes.append(change))
+
+    async def main():
+        for _ in range(2):
+            try:
+                await breaker(Request("GET", "weather"), _failing)
+            except ConnectionError:
+                pass
+
+    asyncio.run(main())
+    assert changes == [("weather", "closed", "open")]
+    assert breaker.states()["weather"]["state"] == "open"
+    time.sleep(0.06)
+    assert breaker.states()["weather"]["state"] == "half-open"
+    assert breaker.state("weather") == "half-open"
+    assert breaker.circuits["weather"].state == "open"
+    assert changes == [("weather", "closed", "open")]
@@ -0,0 +1,90 @@
+"""
+SafoneAPI v1.0
+Copyright (c) 2025 AsmSafone
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import asyncio
+
+from SafoneAPI.coalesce import Coalescer
+from SafoneAPI.middleware import Request, Response
+
+
+class _Upstream:
+    def __init__(self):
+        self.calls = 0
+        self.cancelled = 0
+
+    async def __call__(self, request):
+        self.calls += 1
+        try:
+            await asyncio.sleep(0.05)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        return Response(200, {}, {"route": request.route})
+
+
+def _request():
+    return Request("GET", "weather", params={"city": "Dhaka"})
+
+
+def test_cancelled_leader_keeps_shared_call():
+    async def main():
+        coalescer, upstream = Coalescer(), _Upstream()
+        leader = asyncio.ensure_future(coalescer(_request(), upstream))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(coalescer(_request(), upstream))
+        await asyncio.sleep(0)
+        leader.cancel()
+        response = await follower
+        assert response.data == {"route": "weather"}
+        assert leader.cancelled()
+        assert (upstream.calls, upstream.cancelled) == (1, 0)
+        assert coalescer.in_flight == 0
+
+    asyncio.run(main())
+
+
+def test_last_waiter_cancels_shared_call():
+    async def main():
+        coalescer, upstream = Coalescer(), _Upstream()
+        waiters = [asyncio.ensure_future(coalescer(_request(), upstream)) for _ in range(3)]
+        await asyncio.sleep(0.01)
+        for waiter in waiters:
+            waiter.cancel()
+        await asyncio.gather(*waiters, return_exceptions=True)
+        await asyncio.sleep(0)
+        assert (upstream.calls, upstream.cancelled) == (1, 1)
+        assert coalescer.in_flight == 0
+        response = await coalescer(_request(), upstream)
+        assert response.status == 200 and upstream.calls == 2
+
+    asyncio.run(main())
+
+
+def test_concurrent_calls_share_one_upstream_call():
+    async def main():
+        coalescer, upstream = Coalescer(), _Upstream()
+        responses = await asyncio.gather(*(coalescer(_request(), upstream) for _ in range(5)))
+        assert upstream.calls == 1
+        assert all(response is responses[0] for response in responses)
+
+    asyncio.run(main())
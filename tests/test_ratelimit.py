@@ -0,0 +1,87 @@
+"""
+SafoneAPI v1.0
+Copyright (c) 2025 AsmSafone
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import asyncio
+import logging
+import sqlite3
+
+from SafoneAPI.ratelimit import SharedTokenBucket, SQLiteRateStore, TokenBucket
+
+
+def test_bucket_is_usable_from_several_loops():
+    bucket = TokenBucket(rate=200, capacity=1)
+
+    async def burst():
+        await asyncio.gather(*(bucket.acquire() for _ in range(5)))
+
+    asyncio.run(burst())
+    asyncio.run(burst())
+    assert bucket.waiting == 0
+
+
+def test_shared_rewards_are_batched(tmp_path):
+    store = SQLiteRateStore(str(tmp_path / "rate.db"))
+    writes = []
+    modify = store.modify
+
+    def counting(key, func):
+        writes.append(key)
+        return modify(key, func)
+
+    store.modify = counting
+    bucket = SharedTokenBucket(store, "global", rate=10, reward_interval=60)
+
+    async def main():
+        await bucket.acquire()
+        bucket.penalize()
+        await asyncio.sleep(0.05)
+        del writes[:]
+        for _ in range(20):
+            bucket.reward()
+        await asyncio.sleep(0.05)
+
+    asyncio.run(main())
+    store.close()
+    assert writes == ["global"]
+    assert bucket.rate == 5.5
+    assert bucket._rewards == 19
+
+
+def test_shared_write_errors_are_logged(tmp_path, caplog):
+    store = SQLiteRateStore(str(tmp_path / "rate.db"))
+
+    def locked(key, func):
+        raise sqlite3.OperationalError("database is locked")
+
+    store.modify = locked
+    bucket = SharedTokenBucket(store, "route:imagine", rate=1)
+
+    async def main():
+        bucket.penalize(retry_after=1)
+        await asyncio.sleep(0.05)
+
+    with caplog.at_level(logging.ERROR, logger="SafoneAPI.ratelimit"):
+        asyncio.run(main())
+    store.close()
+    assert "route:imagine" in caplog.text
+    assert "database is locked" in caplog.text
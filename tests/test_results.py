@@ -0,0 +1,121 @@
+"""
+SafoneAPI v1.0
+Copyright (c) 2025 AsmSafone
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import copy
+import json
+import pickle
+
+import pytest
+
+from SafoneAPI.results import Result
+
+
+def test_pickle_round_trip():
+    result = Result({"user": {"name": "safone"}, "repos": [{"stars": 1}]})
+    result.user
+    loaded = pickle.loads(pickle.dumps(result))
+    assert type(loaded) is Result
+    assert loaded == result
+    assert loaded.user.name == "safone"
+    assert loaded.repos[0].stars == 1
+    assert copy.deepcopy(result).repos[0].stars == 1
+
+
+def test_dunder_attributes_are_not_keys():
+    result = Result({"a": 1})
+    assert result.missing is None
+    assert not hasattr(result, "__getstate_extra__")
+
+
+def _result():
+    return Result({
+        "user": {"name": "safone", "links": {"github": "AsmSafone"}},
+        "repos": [{"name": "SafoneAPI", "topics": ["api"]}, "archived", 3],
+        "count": 2,
+    })
+
+
+def test_nested_access_wraps_once():
+    result = _result()
+    assert result.user.links.github == "AsmSafone"
+    assert result["user"]["links"]["github"] == "AsmSafone"
+    assert result.user is result.user
+    assert result.repos is result["repos"]
+    assert isinstance(result.repos[0], Result)
+    assert result.repos[0].topics == ["api"]
+    assert result.repos[1:] == ["archived", 3]
+    assert result.missing is None and result["missing"] is None
+
+
+def test_iteration_yields_wrapped_values():
+    result = _result()
+    assert list(result) == ["user", "repos", "count"]
+    assert all(isinstance(value, Result) for key, value in result.items() if key == "user")
+    assert isinstance(list(result.values())[0], Result)
+    assert isinstance(dict(result)["user"], Result)
+    assert isinstance({**result}["user"], Result)
+    assert [key for key in result if isinstance(result[key], Result)] == ["user"]
+
+
+def test_copy_pop_popitem_setdefault():
+    result = _result()
+    copied = result.copy()
+    assert copied == result and isinstance(copied["user"], Result)
+    assert copied["user"] is result.user
+
+    user = result.pop("user")
+    assert isinstance(user, Result) and user.name == "safone"
+    assert result.pop("user", "gone") == "gone"
+    with pytest.raises(KeyError):
+        result.pop("user")
+
+    key, value = Result({"a": {"b": 1}}).popitem()
+    assert key == "a" and value.b == 1
+
+    assert isinstance(result.setdefault("repos", None), list)
+    assert result.setdefault("repos", None)[0].name == "SafoneAPI"
+    assert result.setdefault("extra", {"x": 1}) == {"x": 1}
+    assert result.extra.x == 1
+
+
+def test_attribute_assignment_and_deletion():
+    result = _result()
+    result.success = True
+    assert result["success"] is True
+    del result.count
+    assert "count" not in result
+
+
+def test_dict_and_json_round_trip():
+    data = {
+        "user": {"name": "safone", "links": {"github": "AsmSafone"}},
+        "repos": [{"name": "SafoneAPI", "topics": ["api"]}, "archived", 3],
+        "count": 2,
+    }
+    result = Result(json.loads(json.dumps(data)))
+    result.user.links
+    result.repos[0].topics
+    assert result == data
+    assert dict(result) == data
+    assert json.loads(json.dumps(result)) == data
+    assert Result(json.loads(json.dumps(result))) == result
@@ -0,0 +1,125 @@
+"""
+SafoneAPI v1.0
+Copyright (c) 2025 AsmSafone
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import json
+import os
+import random
+from base64 import b64encode
+
+import pytest
+
+from SafoneAPI.streaming import MediaStreamParser
+
+
+def _media(rng):
+    return b64encode(os.urandom(rng.choice([1, 2, 3, 700, 768, 769, 3000]))).decode()
+
+
+def _value(rng):
+    return rng.choice([
+        lambda: _media(rng),
+        lambda: "é" * rng.choice([10, 700]),
+        lambda: "x" * rng.choice([1023, 1024, 2000]) + "\\",
+        lambda: "A" * 1500 + '"quoted" \\ ' + "B" * 1500,
+        lambda: "QR==" * 400,
+        lambda: "QUJD" * 300 + "\n",
+        lambda: "QUJD" * 300 + "A",
+        lambda: "short",
+    ])()
+
+
+def _body(rng):
+    images = [_value(rng) for _ in range(rng.randint(1, 3))]
+    data = {
+        "type": rng.choice(["image/png", "audio/mp3", None]),
+        "image": images if rng.random() < 0.5 else images[0],
+        "results": [{"audio": _value(rng), "title": _value(rng)}],
+    }
+    text = json.dumps(data, ensure_ascii=rng.random() < 0.5)
+    if rng.random() < 0.5:
+        text = text.replace("/", "\\/")
+    return data, text.encode()
+
+
+def _split(rng, body):
+    chunks, start = [], 0
+    while start < len(body):
+        end = start + rng.choice([1, 2, 3, 5, 64, 1000, 4096])
+        chunks.append(body[start:end])
+        start = end
+    return chunks
+
+
+def _same(value, expected):
+    if isinstance(value, bytes):
+        return b64encode(value).decode() == expected
+    return value == expected
+
+
+@pytest.mark.parametrize("seed", range(300))
+def test_random_chunk_splits(seed):
+    rng = random.Random(seed)
+    data, body = _body(rng)
+    parser = MediaStreamParser()
+    for chunk in _split(rng, body):
+        parser.feed(chunk)
+    result = parser.close()
+
+    assert parser.size == len(body)
+    assert result["results"] == data["results"]
+    if data["type"]:
+        images = result["image"] if isinstance(data["image"], list) else [result["image"]]
+        expected = data["image"] if isinstance(data["image"], list) else [data["image"]]
+        assert all(_same(value, item) for value, item in zip(images, expected))
+    else:
+        assert result == data
+
+
+def test_unicode_escapes_are_kept():
+    data = {"image": "é" * 700}
+    parser = MediaStreamParser()
+    parser.feed(json.dumps(data).encode())
+    assert parser.close() == data
+
+
+def test_trailing_backslash_is_kept():
+    data = {"results": [{"audio": "x" * 2000 + "\\"}]}
+    parser = MediaStreamParser()
+    parser.feed(json.dumps(data).encode())
+    assert parser.close() == data
+
+
+def test_media_is_decoded():
+    media = os.urandom(5000)
+    body = json.dumps({"type": "image/png", "image": [b64encode(media).decode()]}).encode()
+    parser = MediaStreamParser()
+    for start in range(0, len(body), 7):
+        parser.feed(body[start:start + 7])
+    assert parser.close()["image"] == [media]
+
+
+def test_truncated_body_raises():
+    parser = MediaStreamParser()
+    parser.feed(b'{"image": "' + b"QUJD" * 500)
+    with pytest.raises(ValueError):
+        parser.close()